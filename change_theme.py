@@ -1,3 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -6,36 +10,90 @@ from dash.dependencies import Input, Output, State
 from dash import dash_table
 from plotly.subplots import make_subplots
 
+from sales_data_cache import load_sales_data, parse_dates
+
 # Load the dataset
 file_path = 'Balaji Fast Food Sales.csv'
-sales_over_time = pd.read_csv(file_path)
-
-# Ensure sales_over_time['date'] is in datetime format
-def parse_date(date_str):
-    for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y'):
-        try:
-            return pd.to_datetime(date_str, format=fmt)
-        except ValueError:
-            pass
-    return pd.to_datetime(date_str, errors='coerce')
-
-sales_over_time['date'] = sales_over_time['date'].apply(parse_date)
-
-# Drop rows with invalid dates
-sales_over_time = sales_over_time.dropna(subset=['date'])
-
-# Extract month and year for filtering
-sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str)
-
-# Ensure 'time_of_sale' has the correct order
-time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
-sales_over_time['time_of_sale'] = pd.Categorical(sales_over_time['time_of_sale'], categories=time_of_sale_order, ordered=True)
-
-# Drop rows with null transaction types
-sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
-
-# Ensure transaction_type has no leading/trailing spaces
-sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip()
+parquet_stem = 'Balaji Fast Food Sales.change_theme'
+
+def load_sales_csv(file_path):
+    # Low-cardinality text columns are read as categoricals so filters and groupbys work on integer codes
+    sales_over_time = pd.read_csv(file_path, dtype={
+        'item_name': 'category',
+        'item_type': 'category',
+        'transaction_type': 'category',
+        'received_by': 'category',
+        'time_of_sale': 'category',
+        'quantity': 'int32',
+        'transaction_amount': 'float32'
+    })
+
+    sales_over_time['date'] = parse_dates(sales_over_time['date'])
+
+    # Drop rows with invalid dates
+    sales_over_time = sales_over_time.dropna(subset=['date'])
+
+    # Extract month and year for filtering
+    sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str)
+
+    # Ensure 'time_of_sale' has the correct order
+    time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
+    sales_over_time['time_of_sale'] = sales_over_time['time_of_sale'].cat.set_categories(time_of_sale_order, ordered=True)
+
+    # Drop rows with null transaction types
+    sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
+
+    # Ensure transaction_type has no leading/trailing spaces
+    sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip().astype('category')
+    return sales_over_time
+
+# The cleaned dataset is cached as Parquet next to the CSV, so later starts skip the CSV and date parsing;
+# see sales_data_cache for when the cache is rebuilt
+sales_over_time = load_sales_data(file_path, parquet_stem, load_sales_csv)
+
+# Keep the filtered columns as plain arrays so update_dashboard builds its row mask with numpy
+date_values = sales_over_time['date'].to_numpy()
+transaction_amount_values = sales_over_time['transaction_amount'].to_numpy()
+quantity_values = sales_over_time['quantity'].to_numpy()
+item_type_codes = sales_over_time['item_type'].cat.codes.to_numpy()
+item_name_codes = sales_over_time['item_name'].cat.codes.to_numpy()
+transaction_type_codes = sales_over_time['transaction_type'].cat.codes.to_numpy()
+
+# One boolean row mask per category, so a dropdown selection is an OR over the selected categories' rows
+def category_row_masks(codes, categories):
+    return np.arange(len(categories))[:, np.newaxis] == codes
+
+def selected_category_rows(row_masks, column, selected):
+    selected_codes = sales_over_time[column].cat.categories.get_indexer(selected)
+    return np.logical_or.reduce(row_masks[selected_codes[selected_codes >= 0]], axis=0)
+
+item_type_row_masks = category_row_masks(item_type_codes, sales_over_time['item_type'].cat.categories)
+item_name_row_masks = category_row_masks(item_name_codes, sales_over_time['item_name'].cat.categories)
+transaction_type_row_masks = category_row_masks(transaction_type_codes, sales_over_time['transaction_type'].cat.categories)
+
+# Integer group codes and their labels for the grouped sums in compute_aggregates
+received_by_codes = sales_over_time['received_by'].cat.codes.to_numpy()
+time_of_sale_codes = sales_over_time['time_of_sale'].cat.codes.to_numpy()
+day_codes, sales_days = pd.factorize(sales_over_time['date'], sort=True)
+day_name_codes, day_names = pd.factorize(sales_over_time['date'].dt.day_name(), sort=True)
+
+# order_id is unique per row in this dataset, so the transaction count is just the number of selected rows;
+# otherwise distinct orders are counted on factorized integer codes
+order_ids_are_unique = sales_over_time['order_id'].is_unique
+order_id_codes = None if order_ids_are_unique else pd.factorize(sales_over_time['order_id'])[0]
+
+def count_transactions(mask):
+    if order_ids_are_unique:
+        return int(np.count_nonzero(mask))
+    return np.unique(order_id_codes[mask]).size
+
+# Static filter choices and bounds for the layout, computed once from the loaded data
+item_types = sales_over_time['item_type'].cat.categories.tolist()
+item_names = sales_over_time['item_name'].cat.categories.tolist()
+payment_methods = sales_over_time['transaction_type'].cat.categories.tolist()
+first_sales_date, last_sales_date = sales_days[0], sales_days[-1]
+transaction_amount_min, transaction_amount_max = float(transaction_amount_values.min()), float(transaction_amount_values.max())
+quantity_min, quantity_max = int(quantity_values.min()), int(quantity_values.max())
 
 # Calculate Overall Performance Metrics
 total_sales = sales_over_time['transaction_amount'].sum()
@@ -69,59 +127,80 @@ theme = 'light'
 def get_color_palette(theme):
     return dark_color_palette if theme == 'dark' else color_palette
 
-# Create Sales Trends Figures
-def create_sales_trends_figures(sales_data, color_palette):
-    sales_over_day_fig = px.line(
-        sales_data.groupby(sales_data['date'].dt.date)['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales Trends Over Day',
-        color_discrete_sequence=[color_palette['primary']]
-    )
-    sales_over_day_fig.update_layout(
-        plot_bgcolor=color_palette['background'],
-        xaxis_showgrid=True,
-        yaxis_showgrid=True,
-        xaxis_gridcolor=color_palette['grid'],
-        yaxis_gridcolor=color_palette['grid']
-    )
-
-    sales_over_week_fig = px.line(
-        sales_data.groupby(sales_data['date'].dt.to_period('W').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales Trends Over Week',
-        color_discrete_sequence=[color_palette['primary']]
-    )
-    sales_over_week_fig.update_layout(
+# Sum values per group code over the rows selected by mask, keeping only the groups that occur
+def masked_group_sum(codes, values, labels, mask, name):
+    selected_codes = codes[mask]
+    counts = np.bincount(selected_codes, minlength=len(labels))
+    sums = np.bincount(selected_codes, weights=values[mask], minlength=len(labels))
+    present = counts > 0
+    return pd.Series(sums[present], index=labels[present], name=name)
+
+# Largest n entries of a grouped total in descending order, same as Series.nlargest(n) but found with a partition
+def top_n(series, n=5):
+    values = series.to_numpy()
+    top = np.arange(values.size)
+    if values.size > n:
+        # Everything above the n-th largest value, then the earliest entries tied with it
+        threshold = np.partition(values, values.size - n)[values.size - n]
+        top = np.flatnonzero(values > threshold)
+        top = np.concatenate([top, np.flatnonzero(values == threshold)[:n - top.size]])
+    return series.iloc[top[np.lexsort((top, -values[top]))]]
+
+# Compute every grouped total the figures need from the filter mask in a single place
+def compute_aggregates(mask):
+    daily_sales = masked_group_sum(day_codes, transaction_amount_values, sales_days.rename('date'), mask, 'transaction_amount')
+    selected_amounts = transaction_amount_values[mask]
+    return {
+        'total_sales': selected_amounts.sum(),
+        'average_transaction_amount': selected_amounts.mean(dtype=np.float64) if selected_amounts.size else np.nan,
+        'number_of_transactions': count_transactions(mask),
+        'daily_sales': daily_sales,
+        # Weekly and monthly totals are rolled up from the small daily series
+        'weekly_sales': daily_sales.groupby(daily_sales.index.to_period('W').start_time.rename('date')).sum(),
+        'monthly_sales': daily_sales.groupby(daily_sales.index.to_period('M').start_time.rename('date')).sum(),
+        'sales_by_payment': masked_group_sum(transaction_type_codes, transaction_amount_values, sales_over_time['transaction_type'].cat.categories.rename('transaction_type'), mask, 'transaction_amount'),
+        'sales_by_staff': masked_group_sum(received_by_codes, transaction_amount_values, sales_over_time['received_by'].cat.categories.rename('received_by'), mask, 'transaction_amount'),
+        'quantity_by_item': masked_group_sum(item_name_codes, quantity_values, sales_over_time['item_name'].cat.categories.rename('item_name'), mask, 'quantity'),
+        'sales_by_item': masked_group_sum(item_name_codes, transaction_amount_values, sales_over_time['item_name'].cat.categories.rename('item_name'), mask, 'transaction_amount'),
+        'sales_by_day_of_week': masked_group_sum(day_name_codes, transaction_amount_values, day_names.rename('date'), mask, 'transaction_amount'),
+    }
+
+# Line chart of a date-indexed total, drawn with graph_objects directly instead of px.line
+def create_line_figure(series, title, color_palette):
+    fig = go.Figure(go.Scatter(
+        x=series.index,
+        y=series.to_numpy(),
+        mode='lines',
+        line_color=color_palette['primary'],
+        hovertemplate=f'{series.index.name}=%{{x}}<br>{series.name}=%{{y}}<extra></extra>'
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=series.index.name,
+        yaxis_title=series.name,
         plot_bgcolor=color_palette['background'],
         xaxis_showgrid=True,
         yaxis_showgrid=True,
         xaxis_gridcolor=color_palette['grid'],
         yaxis_gridcolor=color_palette['grid']
     )
+    return fig
 
-    sales_over_month_fig = px.line(
-        sales_data.groupby(sales_data['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales Trends Over Month',
-        color_discrete_sequence=[color_palette['primary']]
-    )
-    sales_over_month_fig.update_layout(
-        plot_bgcolor=color_palette['background'],
-        xaxis_showgrid=True,
-        yaxis_showgrid=True,
-        xaxis_gridcolor=color_palette['grid'],
-        yaxis_gridcolor=color_palette['grid']
-    )
+# Create Sales Trends Figures
+def create_sales_trends_figures(daily_sales, weekly_sales, monthly_sales, color_palette):
+    sales_over_day_fig = create_line_figure(daily_sales, 'Sales Trends Over Day', color_palette)
+    sales_over_week_fig = create_line_figure(weekly_sales, 'Sales Trends Over Week', color_palette)
+    sales_over_month_fig = create_line_figure(monthly_sales, 'Sales Trends Over Month', color_palette)
 
     return sales_over_day_fig, sales_over_week_fig, sales_over_month_fig
 
+def three_month_moving_average(monthly_sales):
+    return monthly_sales.rolling(window=3, min_periods=1).mean()
+
 # Create Interactive Line Chart with Monthly Sales Trends and 3-Month Moving Average
-def create_interactive_sales_trends_fig(sales_data, color_palette):
-    monthly_sales = sales_data.groupby(sales_data['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index()
-    monthly_sales['3_month_MA'] = monthly_sales['transaction_amount'].rolling(window=3, min_periods=1).mean()
+def create_interactive_sales_trends_fig(monthly_sales, color_palette):
+    monthly_sales = monthly_sales.reset_index()
+    monthly_sales['3_month_MA'] = three_month_moving_average(monthly_sales['transaction_amount'])
 
     fig = make_subplots(specs=[[{"secondary_y": True}]])
 
@@ -150,100 +229,92 @@ def create_interactive_sales_trends_fig(sales_data, color_palette):
 
     return fig
 
-# Create Figures for Operational Performance and Item-Based Sales Analysis
-def create_additional_figures(sales_data, color_palette):
-    payment_method_fig = px.pie(
-        sales_data,
-        names='transaction_type',
-        values='transaction_amount',
-        title='Sales by Payment Method',
-        color_discrete_sequence=color_palette['categories']
-    )
-    payment_method_fig.update_layout(
-        plot_bgcolor=color_palette['background']
-    )
-
-    staff_performance_fig = px.bar(
-        sales_data.groupby('received_by')['transaction_amount'].sum().reset_index(),
-        x='received_by',
-        y='transaction_amount',
-        title='Sales by Staff Gender',
-        color='received_by',
-        color_discrete_sequence=color_palette['categories']
-    )
-    staff_performance_fig.update_layout(
+# One colored trace per category of a grouped total, like px.bar/px.scatter with color=<category column>
+def create_category_figure(series, title, color_palette, trace_type=go.Bar, **trace_kwargs):
+    fig = go.Figure()
+    categories = color_palette['categories']
+    for i, (label, value) in enumerate(series.items()):
+        fig.add_trace(trace_type(
+            x=[label],
+            y=[value],
+            name=label,
+            legendgroup=label,
+            marker_color=categories[i % len(categories)],
+            hovertemplate=f'{series.index.name}={label}<br>{series.name}=%{{y}}<extra></extra>',
+            **trace_kwargs
+        ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=series.index.name,
+        yaxis_title=series.name,
+        legend_title_text=series.index.name,
+        barmode='relative',
         plot_bgcolor=color_palette['background'],
         xaxis_showgrid=True,
         yaxis_showgrid=True,
         xaxis_gridcolor=color_palette['grid'],
         yaxis_gridcolor=color_palette['grid']
     )
+    return fig
 
-    item_preferences_fig = px.bar(
-        sales_data.groupby('item_name')['quantity'].sum().nlargest(5).reset_index(),
-        x='item_name',
-        y='quantity',
-        title='Top-Selling Items',
-        color='item_name',
-        color_discrete_sequence=color_palette['categories']
-    )
-    item_preferences_fig.update_layout(
-        plot_bgcolor=color_palette['background'],
-        xaxis_showgrid=True,
-        yaxis_showgrid=True,
-        xaxis_gridcolor=color_palette['grid'],
-        yaxis_gridcolor=color_palette['grid']
+# Create Figures for Operational Performance and Item-Based Sales Analysis
+def create_additional_figures(aggregates, color_palette):
+    sales_by_payment = aggregates['sales_by_payment']
+    payment_method_fig = go.Figure(go.Pie(
+        labels=sales_by_payment.index,
+        values=sales_by_payment.to_numpy()
+    ))
+    payment_method_fig.update_layout(
+        title='Sales by Payment Method',
+        piecolorway=color_palette['categories'],
+        plot_bgcolor=color_palette['background']
     )
 
-    high_revenue_items_fig = px.scatter(
-        sales_data.groupby('item_name')['transaction_amount'].sum().nlargest(5).reset_index(),
-        x='item_name',
-        y='transaction_amount',
-        size='transaction_amount',
-        title='High-Revenue Items',
-        color='item_name',
-        color_discrete_sequence=color_palette['categories']
-    )
-    high_revenue_items_fig.update_layout(
-        plot_bgcolor=color_palette['background'],
-        xaxis_showgrid=True,
-        yaxis_showgrid=True,
-        xaxis_gridcolor=color_palette['grid'],
-        yaxis_gridcolor=color_palette['grid']
-    )
+    staff_performance_fig = create_category_figure(aggregates['sales_by_staff'], 'Sales by Staff Gender', color_palette)
 
-    day_of_week_fig = px.bar(
-        sales_data.groupby(sales_data['date'].dt.day_name(), observed=False)['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales by Day of Week',
-        color='date',
-        color_discrete_sequence=color_palette['categories']
-    )
-    day_of_week_fig.update_layout(
-        plot_bgcolor=color_palette['background'],
-        xaxis_showgrid=True,
-        yaxis_showgrid=True,
-        xaxis_gridcolor=color_palette['grid'],
-        yaxis_gridcolor=color_palette['grid']
+    item_preferences_fig = create_category_figure(top_n(aggregates['quantity_by_item']), 'Top-Selling Items', color_palette)
+
+    # Marker areas scale with revenue the way px.scatter(size=..., size_max=20) sizes them
+    top_revenue_items = top_n(aggregates['sales_by_item'])
+    high_revenue_items_fig = create_category_figure(
+        top_revenue_items,
+        'High-Revenue Items',
+        color_palette,
+        trace_type=go.Scatter,
+        mode='markers',
+        marker_sizemode='area',
+        marker_sizeref=top_revenue_items.max() / 20 ** 2 if len(top_revenue_items) else 1
     )
+    for trace in high_revenue_items_fig.data:
+        trace.marker.size = trace.y
+    high_revenue_items_fig.update_layout(legend_itemsizing='constant')
+
+    day_of_week_fig = create_category_figure(aggregates['sales_by_day_of_week'], 'Sales by Day of Week', color_palette)
 
     return payment_method_fig, staff_performance_fig, item_preferences_fig, high_revenue_items_fig, day_of_week_fig
 
-def create_heatmap_figure(sales_data, color_palette):
-    # Create the heatmap data
-    heatmap_data = sales_data.pivot_table(index='time_of_sale', columns='item_name', values='quantity', aggfunc='sum', fill_value=0, observed=False).reset_index().melt(id_vars='time_of_sale', value_vars=sales_data['item_name'].unique())
+def create_heatmap_figure(mask, color_palette):
+    # Sum the quantity of every (time of sale, item) cell in one bincount over the combined codes
+    time_of_sale_labels = sales_over_time['time_of_sale'].cat.categories
+    item_name_labels = sales_over_time['item_name'].cat.categories
+    cell_codes = time_of_sale_codes[mask].astype(np.int64) * len(item_name_labels) + item_name_codes[mask]
+    heatmap_data = np.bincount(cell_codes, weights=quantity_values[mask], minlength=len(time_of_sale_labels) * len(item_name_labels)).reshape(len(time_of_sale_labels), len(item_name_labels))
+
+    # Only the items sold under the current filters get a column
+    sold_items = np.bincount(item_name_codes[mask], minlength=len(item_name_labels)) > 0
 
     # Create the heatmap figure
-    heatmap_fig = px.density_heatmap(
-        heatmap_data,
-        x='item_name',
-        y='time_of_sale',
-        z='value',
-        title='Item Popularity Heatmap',
-        color_continuous_scale=px.colors.sequential.Blues
-    )
+    heatmap_fig = go.Figure(data=go.Heatmap(
+        z=heatmap_data[:, sold_items],
+        x=item_name_labels[sold_items],
+        y=time_of_sale_labels,
+        colorscale=px.colors.sequential.Blues,
+        colorbar=dict(title='sum of value')
+    ))
     heatmap_fig.update_layout(
+        title='Item Popularity Heatmap',
+        xaxis_title='item_name',
+        yaxis_title='time_of_sale',
         plot_bgcolor=color_palette['background'],
         xaxis_showgrid=True,
         yaxis_showgrid=True,
@@ -253,24 +324,34 @@ def create_heatmap_figure(sales_data, color_palette):
 
     return heatmap_fig
 
-def create_sankey_figure(sales_data, color_palette):
-    sankey_data = sales_data.groupby(['item_name', 'item_type', 'transaction_type']).size().reset_index(name='count')
-    all_nodes = list(sankey_data['item_name'].unique()) + list(sankey_data['item_type'].unique()) + list(sankey_data['transaction_type'].unique())
-    node_indices = {node: i for i, node in enumerate(all_nodes)}
+def create_sankey_figure(mask, color_palette):
+    # Count orders per (item, type, payment method) code combination; columns come out sorted like a groupby
+    combinations, counts = np.unique(np.stack([item_name_codes[mask], item_type_codes[mask], transaction_type_codes[mask]]), axis=1, return_counts=True)
+    items, item_indices = np.unique(combinations[0], return_inverse=True)
+    item_types, item_type_indices = np.unique(combinations[1], return_inverse=True)
+    payments, payment_indices = np.unique(combinations[2], return_inverse=True)
+    all_nodes = (
+        sales_over_time['item_name'].cat.categories[items].tolist() +
+        sales_over_time['item_type'].cat.categories[item_types].tolist() +
+        sales_over_time['transaction_type'].cat.categories[payments].tolist()
+    )
+
+    # Links go item -> item type, then item type -> payment method; node indices are offset per column
+    item_type_nodes = item_type_indices + len(items)
+    payment_nodes = payment_indices + len(items) + len(item_types)
     sankey_fig = go.Figure(data=[go.Sankey(
         node=dict(
             pad=15,
             thickness=20,
             line=dict(color='black', width=0.5),
             label=all_nodes,
-            color=color_palette['categories']
+            # Repeat the palette so every node gets a color, not just the first five
+            color=np.resize(color_palette['categories'], len(all_nodes)).tolist()
         ),
         link=dict(
-            source=[node_indices[item] for item in sankey_data['item_name']] + 
-                   [node_indices[item] for item in sankey_data['item_type']],
-            target=[node_indices[item] for item in sankey_data['item_type']] + 
-                   [node_indices[item] for item in sankey_data['transaction_type']],
-            value=sankey_data['count'].tolist() * 2,
+            source=np.concatenate([item_indices, item_type_nodes]),
+            target=np.concatenate([item_type_nodes, payment_nodes]),
+            value=np.tile(counts, 2),
             color='rgba(31, 119, 180, 0.5)'
         )
     )])
@@ -283,6 +364,50 @@ def create_sankey_figure(sales_data, color_palette):
 
     return sankey_fig
 
+# Layout and trace styling of each sales trends figure per theme, built once from the full dataset.
+# The browser fills in the x/y values from sales-trends-store, so callbacks never rebuild these figures.
+def create_sales_trends_skeletons(aggregates):
+    skeletons = {}
+    for theme_name in ('light', 'dark'):
+        palette = get_color_palette(theme_name)
+        sales_over_day_fig, sales_over_week_fig, sales_over_month_fig = create_sales_trends_figures(aggregates['daily_sales'], aggregates['weekly_sales'], aggregates['monthly_sales'], palette)
+        figures = {
+            'day': sales_over_day_fig,
+            'week': sales_over_week_fig,
+            'month': sales_over_month_fig,
+            'interactive': create_interactive_sales_trends_fig(aggregates['monthly_sales'], palette),
+            'time_of_day': create_additional_figures(aggregates, palette)[4]
+        }
+        skeletons[theme_name] = {}
+        for name, fig in figures.items():
+            fig_dict = fig.to_dict()
+            for trace in fig_dict['data']:
+                trace.pop('x', None)
+                trace.pop('y', None)
+            skeletons[theme_name][name] = fig_dict
+    return skeletons
+
+sales_trends_skeletons = create_sales_trends_skeletons(compute_aggregates(np.ones(len(sales_over_time), dtype=bool)))
+
+def series_trace_data(series):
+    return {'x': series.index.strftime('%Y-%m-%d').tolist(), 'y': series.tolist()}
+
+# x/y values for every trace of the sales trends skeletons, in the same trace order
+def sales_trends_data(aggregates):
+    monthly_sales = aggregates['monthly_sales']
+    sales_by_day_of_week = aggregates['sales_by_day_of_week']
+    return {
+        'day': [series_trace_data(aggregates['daily_sales'])],
+        'week': [series_trace_data(aggregates['weekly_sales'])],
+        'month': [series_trace_data(monthly_sales)],
+        'interactive': [series_trace_data(monthly_sales), series_trace_data(three_month_moving_average(monthly_sales))],
+        # One bar trace per weekday; weekdays without sales are left out of the figure
+        'time_of_day': [
+            {'x': [trace['name']], 'y': [float(sales_by_day_of_week[trace['name']])]} if trace['name'] in sales_by_day_of_week.index else None
+            for trace in sales_trends_skeletons['light']['time_of_day']['data']
+        ]
+    }
+
 # Initialize the Dash app
 app = Dash(__name__)
 app.config.suppress_callback_exceptions = True
@@ -309,6 +434,8 @@ app.layout = html.Div([
 
     html.Div([
         html.Button('Toggle Theme', id='toggle-theme-button', n_clicks=0),
+        # The current theme lives in the browser, so callbacks never share it through module state
+        dcc.Store(id='theme-store', data=theme),
     ], style={'textAlign': 'center', 'margin-bottom': '20px'}),
 
     html.Div([
@@ -316,8 +443,8 @@ app.layout = html.Div([
             html.Label('Select Date Range:'),
             dcc.DatePickerRange(
                 id='date-range',
-                start_date=sales_over_time['date'].min(),
-                end_date=sales_over_time['date'].max(),
+                start_date=first_sales_date,
+                end_date=last_sales_date,
                 display_format='YYYY-MM-DD',
                 style={'margin': '10px'}
             ),
@@ -326,8 +453,8 @@ app.layout = html.Div([
             html.Label('Filter by Item Type:'),
             dcc.Dropdown(
                 id='item-type-dropdown',
-                options=[{'label': item_type, 'value': item_type} for item_type in sales_over_time['item_type'].unique()],
-                value=sales_over_time['item_type'].unique().tolist(),
+                options=[{'label': item_type, 'value': item_type} for item_type in item_types],
+                value=item_types,
                 multi=True,
                 clearable=False
             ),
@@ -336,8 +463,8 @@ app.layout = html.Div([
             html.Label('Filter by Item Name:'),
             dcc.Dropdown(
                 id='item-name-dropdown',
-                options=[{'label': item_name, 'value': item_name} for item_name in sales_over_time['item_name'].unique()],
-                value=sales_over_time['item_name'].unique().tolist(),
+                options=[{'label': item_name, 'value': item_name} for item_name in item_names],
+                value=item_names,
                 multi=True,
                 clearable=False
             ),
@@ -346,8 +473,8 @@ app.layout = html.Div([
             html.Label('Filter by Payment Method:'),
             dcc.Dropdown(
                 id='payment-method-dropdown',
-                options=[{'label': method, 'value': method} for method in sales_over_time['transaction_type'].unique()],
-                value=sales_over_time['transaction_type'].unique().tolist(),
+                options=[{'label': method, 'value': method} for method in payment_methods],
+                value=payment_methods,
                 multi=True,
                 clearable=False
             ),
@@ -356,22 +483,22 @@ app.layout = html.Div([
             html.Label('Filter by Transaction Amount:'),
             dcc.RangeSlider(
                 id='transaction-amount-slider',
-                min=sales_over_time['transaction_amount'].min(),
-                max=sales_over_time['transaction_amount'].max(),
-                value=[sales_over_time['transaction_amount'].min(), sales_over_time['transaction_amount'].max()],
-                marks={int(sales_over_time['transaction_amount'].min()): str(int(sales_over_time['transaction_amount'].min())),
-                       int(sales_over_time['transaction_amount'].max()): str(int(sales_over_time['transaction_amount'].max()))}
+                min=transaction_amount_min,
+                max=transaction_amount_max,
+                value=[transaction_amount_min, transaction_amount_max],
+                marks={int(transaction_amount_min): str(int(transaction_amount_min)),
+                       int(transaction_amount_max): str(int(transaction_amount_max))}
             ),
         ], style={'margin': '20px'}),
         html.Div([
             html.Label('Filter by Quantity:'),
             dcc.RangeSlider(
                 id='quantity-slider',
-                min=sales_over_time['quantity'].min(),
-                max=sales_over_time['quantity'].max(),
-                value=[sales_over_time['quantity'].min(), sales_over_time['quantity'].max()],
-                marks={int(sales_over_time['quantity'].min()): str(int(sales_over_time['quantity'].min())),
-                       int(sales_over_time['quantity'].max()): str(int(sales_over_time['quantity'].max()))}
+                min=quantity_min,
+                max=quantity_max,
+                value=[quantity_min, quantity_max],
+                marks={quantity_min: str(quantity_min),
+                       quantity_max: str(quantity_max)}
             ),
         ], style={'margin': '20px'}),
         html.Div([
@@ -394,6 +521,8 @@ app.layout = html.Div([
     html.Div([
         html.Div([
             dcc.Graph(id='sales-trends-over-time'),
+            dcc.Store(id='sales-trends-store'),
+            dcc.Store(id='sales-trends-skeletons', data=sales_trends_skeletons),
         ], style={'gridColumn': '1 / span 2', 'border': '1px solid #dcdcdc', 'padding': '10px', 'backgroundColor': '#f9f9f9'}),
         
         html.Div([
@@ -420,6 +549,9 @@ app.layout = html.Div([
     dash_table.DataTable(
         id='data-table',
         columns=[{"name": i, "id": i} for i in sales_over_time.columns],
+        # Pages are sliced on the server, so only the visible rows are serialized
+        page_action='custom',
+        page_current=0,
         page_size=10,
         style_table={'height': '400px', 'overflowY': 'auto'},
         style_cell={'textAlign': 'left', 'padding': '5px'},
@@ -430,85 +562,176 @@ app.layout = html.Div([
     dcc.Download(id="download-dataframe-csv"),
 ])
 
+# Build the row mask for a filter selection
+def build_filter_mask(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    # Every predicate is ANDed into one mask buffer in place, with a single scratch array for the comparisons
+    mask = np.greater_equal(date_values, pd.Timestamp(start_date).to_datetime64())
+    scratch = np.empty_like(mask)
+    for values, bound, compare in (
+        (date_values, pd.Timestamp(end_date).to_datetime64(), np.less_equal),
+        (transaction_amount_values, transaction_amount_range[0], np.greater_equal),
+        (transaction_amount_values, transaction_amount_range[1], np.less_equal),
+        (quantity_values, quantity_range[0], np.greater_equal),
+        (quantity_values, quantity_range[1], np.less_equal)
+    ):
+        mask &= compare(values, bound, out=scratch)
+    mask &= selected_category_rows(item_type_row_masks, 'item_type', selected_item_types)
+    mask &= selected_category_rows(item_name_row_masks, 'item_name', selected_item_names)
+    mask &= selected_category_rows(transaction_type_row_masks, 'transaction_type', selected_payment_methods)
+    return mask
+
+# Filter-dependent aggregates are cached apart from the figures so toggling the theme reuses them
+@lru_cache(maxsize=128)
+def compute_filtered_aggregates(filter_key):
+    mask = build_filter_mask(*filter_key)
+    return mask, compute_aggregates(mask)
+
+# The figure groups only read the shared mask and aggregates, so they are built side by side
+figure_executor = ThreadPoolExecutor(max_workers=3)
+
+def create_figure_dict(create_figure, *args):
+    return create_figure(*args).to_dict()
+
+def create_additional_figure_dicts(aggregates, color_palette):
+    payment_method_fig, staff_performance_fig, item_preferences_fig, high_revenue_items_fig, day_of_week_fig = create_additional_figures(aggregates, color_palette)
+    return {
+        'payment_method': payment_method_fig.to_dict(),
+        'item_preferences': item_preferences_fig.to_dict(),
+        'high_revenue_items': high_revenue_items_fig.to_dict()
+    }
+
+# Plotly fills in its shared template objects lazily, and that first pass is not thread-safe,
+# so every figure group is built once on this thread before the pool ever runs two of them together
+all_rows = np.ones(len(sales_over_time), dtype=bool)
+all_rows_aggregates = compute_aggregates(all_rows)
+create_additional_figure_dicts(all_rows_aggregates, get_color_palette(theme))
+create_figure_dict(create_heatmap_figure, all_rows, get_color_palette(theme))
+create_figure_dict(create_sankey_figure, all_rows, get_color_palette(theme))
+
+# Build every dashboard output for a filter selection and theme, cached so repeated selections skip the rebuild
+# Figures are stored as plain dicts, which Dash serializes without re-validating them
+@lru_cache(maxsize=128)
+def build_dashboard_outputs(filter_key, theme):
+    color_palette = get_color_palette(theme)
+
+    mask, aggregates = compute_filtered_aggregates(filter_key)
+    additional_figures = figure_executor.submit(create_additional_figure_dicts, aggregates, color_palette)
+    heatmap_fig = figure_executor.submit(create_figure_dict, create_heatmap_figure, mask, color_palette)
+    sankey_fig = figure_executor.submit(create_figure_dict, create_sankey_figure, mask, color_palette)
+
+    return {
+        'total_sales': f"${aggregates['total_sales']:,.2f}",
+        'average_transaction_amount': f"${aggregates['average_transaction_amount']:,.2f}",
+        'number_of_transactions': f"{aggregates['number_of_transactions']:,}",
+        'figures': dict(additional_figures.result(), heatmap=heatmap_fig.result(), sankey=sankey_fig.result()),
+        # The sales trends figure is assembled in the browser from these values and the skeletons
+        'sales_trends': dict(sales_trends_data(aggregates), theme=theme)
+    }
+
+# Dash passes lists; sort them into tuples so equivalent selections share a cache entry
+def make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    return (
+        start_date,
+        end_date,
+        tuple(transaction_amount_range),
+        tuple(quantity_range),
+        tuple(sorted(selected_item_types)),
+        tuple(sorted(selected_item_names)),
+        tuple(sorted(selected_payment_methods))
+    )
+
+# Check for theme toggle
+@app.callback(
+    Output("theme-store", "data"),
+    [Input("toggle-theme-button", "n_clicks")]
+)
+def toggle_theme(toggle_n_clicks):
+    return 'dark' if toggle_n_clicks % 2 == 1 else 'light'
+
 @app.callback(
     [Output("total-sales", "children"),
      Output("average-transaction-amount", "children"),
      Output("number-of-transactions", "children"),
-     Output("sales-trends-over-time", "figure"),
+     Output("sales-trends-store", "data"),
      Output("payment-methods", "figure"),
      Output("top-selling-items", "figure"),
      Output("high-revenue-items", "figure"),
      Output("item-popularity-heatmap", "figure"),
-     Output("sankey-diagram", "figure"),
-     Output("data-table", "data")],
-    [Input("toggle-theme-button", "n_clicks"),
+     Output("sankey-diagram", "figure")],
+    [Input("theme-store", "data"),
      Input("date-range", "start_date"),
      Input("date-range", "end_date"),
      Input("transaction-amount-slider", "value"),
      Input("quantity-slider", "value"),
      Input("item-type-dropdown", "value"),
      Input("item-name-dropdown", "value"),
-     Input("payment-method-dropdown", "value"),
-     Input("sales-trends-dropdown", "value")]
+     Input("payment-method-dropdown", "value")]
 )
-def update_dashboard(toggle_n_clicks, start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, selected_sales_trends):
-    global theme
-    global sales_over_time
-
-    # Check for theme toggle
-    if toggle_n_clicks % 2 == 1:
-        theme = 'dark'
-    else:
-        theme = 'light'
-
-    color_palette = get_color_palette(theme)
-
-    filtered_data = sales_over_time[
-        (sales_over_time['date'] >= start_date) & 
-        (sales_over_time['date'] <= end_date) & 
-        (sales_over_time['transaction_amount'] >= transaction_amount_range[0]) & 
-        (sales_over_time['transaction_amount'] <= transaction_amount_range[1]) &
-        (sales_over_time['quantity'] >= quantity_range[0]) &
-        (sales_over_time['quantity'] <= quantity_range[1]) &
-        (sales_over_time['item_type'].isin(selected_item_types)) &
-        (sales_over_time['item_name'].isin(selected_item_names)) &
-        (sales_over_time['transaction_type'].isin(selected_payment_methods))
-    ]
-
-    total_sales = filtered_data['transaction_amount'].sum()
-    average_transaction_amount = filtered_data['transaction_amount'].mean()
-    number_of_transactions = filtered_data['order_id'].nunique()
-
-    sales_over_day_fig, sales_over_week_fig, sales_over_month_fig = create_sales_trends_figures(filtered_data, color_palette)
-    interactive_sales_trends_fig = create_interactive_sales_trends_fig(filtered_data, color_palette)
-    payment_method_fig, staff_performance_fig, item_preferences_fig, high_revenue_items_fig, day_of_week_fig = create_additional_figures(filtered_data, color_palette)
-    heatmap_fig = create_heatmap_figure(filtered_data, color_palette)
-    sankey_fig = create_sankey_figure(filtered_data, color_palette)
-
-    if selected_sales_trends == 'day':
-        sales_trends_fig = sales_over_day_fig
-    elif selected_sales_trends == 'week':
-        sales_trends_fig = sales_over_week_fig
-    elif selected_sales_trends == 'month':
-        sales_trends_fig = sales_over_month_fig
-    elif selected_sales_trends == 'interactive':
-        sales_trends_fig = interactive_sales_trends_fig
-    elif selected_sales_trends == 'time_of_day':
-        sales_trends_fig = day_of_week_fig
+def update_dashboard(theme, start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    filter_key = make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods)
+    outputs = build_dashboard_outputs(filter_key, theme)
+    figures = outputs['figures']
 
     return (
-        f"${total_sales:,.2f}",
-        f"${average_transaction_amount:,.2f}",
-        f"{number_of_transactions:,}",
-        sales_trends_fig,
-        payment_method_fig,
-        item_preferences_fig,
-        high_revenue_items_fig,
-        heatmap_fig,
-        sankey_fig,
-        filtered_data.to_dict('records')
+        outputs['total_sales'],
+        outputs['average_transaction_amount'],
+        outputs['number_of_transactions'],
+        outputs['sales_trends'],
+        figures['payment_method'],
+        figures['item_preferences'],
+        figures['high_revenue_items'],
+        figures['heatmap'],
+        figures['sankey']
     )
 
+@app.callback(
+    [Output("data-table", "data"),
+     Output("data-table", "page_count")],
+    [Input("date-range", "start_date"),
+     Input("date-range", "end_date"),
+     Input("transaction-amount-slider", "value"),
+     Input("quantity-slider", "value"),
+     Input("item-type-dropdown", "value"),
+     Input("item-name-dropdown", "value"),
+     Input("payment-method-dropdown", "value"),
+     Input("data-table", "page_current"),
+     Input("data-table", "page_size")]
+)
+def update_data_table(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, page_current, page_size):
+    filter_key = make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods)
+    mask, _ = compute_filtered_aggregates(filter_key)
+
+    # Only the rows of the current page are converted to records
+    filtered_rows = np.flatnonzero(mask)
+    page_rows = filtered_rows[page_current * page_size:(page_current + 1) * page_size]
+    page_count = max(1, -(-len(filtered_rows) // page_size))
+
+    return sales_over_time.iloc[page_rows].to_dict('records'), page_count
+
+# Swap the x/y values of the selected sales trends view into its themed skeleton in the browser
+app.clientside_callback(
+    """
+    function(trendsData, selectedSalesTrends, skeletons) {
+        if (!trendsData) {
+            return window.dash_clientside.no_update;
+        }
+        var skeleton = skeletons[trendsData.theme][selectedSalesTrends];
+        var data = [];
+        skeleton.data.forEach(function(trace, i) {
+            var values = trendsData[selectedSalesTrends][i];
+            if (values) {
+                data.push(Object.assign({}, trace, values));
+            }
+        });
+        return {data: data, layout: skeleton.layout};
+    }
+    """,
+    Output("sales-trends-over-time", "figure"),
+    [Input("sales-trends-store", "data"),
+     Input("sales-trends-dropdown", "value")],
+    [State("sales-trends-skeletons", "data")]
+)
+
 @app.callback(
     Output("download-dataframe-csv", "data"),
     [Input("download-button", "n_clicks")],
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -54,7 +56,7 @@ color_palette = {
 
 # Create Sales Trends Figures
 sales_over_day_fig = px.line(
-    sales_over_time.groupby(sales_over_time['date'].dt.date)['transaction_amount'].sum().reset_index(),
+    sales_over_time.groupby(sales_over_time['date'].dt.floor('D'))['transaction_amount'].sum().reset_index(),
     x='date',
     y='transaction_amount',
     title='Sales Trends Over Day',
@@ -63,7 +65,7 @@ sales_over_day_fig = px.line(
 sales_over_day_fig.update_layout(plot_bgcolor=color_palette['background'])
 
 sales_over_week_fig = px.line(
-    sales_over_time.groupby(sales_over_time['date'].dt.to_period('W').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
+    sales_over_time.groupby(sales_over_time['date'].dt.to_period('W').dt.start_time)['transaction_amount'].sum().reset_index(),
     x='date',
     y='transaction_amount',
     title='Sales Trends Over Week',
@@ -72,7 +74,7 @@ sales_over_week_fig = px.line(
 sales_over_week_fig.update_layout(plot_bgcolor=color_palette['background'])
 
 sales_over_month_fig = px.line(
-    sales_over_time.groupby(sales_over_time['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
+    sales_over_time.groupby(sales_over_time['date'].dt.to_period('M').dt.start_time)['transaction_amount'].sum().reset_index(),
     x='date',
     y='transaction_amount',
     title='Sales Trends Over Month',
@@ -81,7 +83,7 @@ sales_over_month_fig = px.line(
 sales_over_month_fig.update_layout(plot_bgcolor=color_palette['background'])
 
 # Create Interactive Line Chart with Monthly Sales Trends and 3-Month Moving Average
-monthly_sales = sales_over_time.groupby(sales_over_time['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index()
+monthly_sales = sales_over_time.groupby(sales_over_time['date'].dt.to_period('M').dt.start_time)['transaction_amount'].sum().reset_index()
 monthly_sales['3_month_MA'] = monthly_sales['transaction_amount'].rolling(window=3).mean()
 
 interactive_sales_trends_fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -350,20 +352,22 @@ app.layout = html.Div([
     dcc.Download(id="download-dataframe-csv")
 ])
 
-@app.callback(
-    [Output("sales-trends-over-time", "figure"),
-     Output("data-table", "data")],
-    [Input("date-range", "start_date"),
-     Input("date-range", "end_date"),
-     Input("transaction-amount-slider", "value"),
-     Input("quantity-slider", "value"),
-     Input("item-type-dropdown", "value"),
-     Input("item-name-dropdown", "value"),
-     Input("payment-method-dropdown", "value"),
-     Input("sales-trends-dropdown", "value")]
-)
-def update_dashboard(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, selected_sales_trends):
-    filtered_data = sales_over_time[
+# Dash passes lists; sort them into tuples so equivalent selections share a cache entry
+def make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    return (
+        start_date,
+        end_date,
+        tuple(transaction_amount_range),
+        tuple(quantity_range),
+        tuple(sorted(selected_item_types)),
+        tuple(sorted(selected_item_names)),
+        tuple(sorted(selected_payment_methods))
+    )
+
+# The filtered rows for a filter selection, cached so the sales trends and table callbacks filter only once between them
+@lru_cache(maxsize=128)
+def filter_sales_data(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    return sales_over_time[
         (sales_over_time['date'] >= start_date) & 
         (sales_over_time['date'] <= end_date) & 
         (sales_over_time['transaction_amount'] >= transaction_amount_range[0]) & 
@@ -375,35 +379,42 @@ def update_dashboard(start_date, end_date, transaction_amount_range, quantity_ra
         (sales_over_time['transaction_type'].isin(selected_payment_methods))
     ]
 
-    # Update Sales Trends Over Day, Week, Month, and Interactive
+# Update Sales Trends Over Day, Week, Month, and Interactive
+def create_sales_over_day_fig(filtered_data):
     sales_over_day_fig = px.line(
-        filtered_data.groupby(filtered_data['date'].dt.date)['transaction_amount'].sum().reset_index(),
+        filtered_data.groupby(filtered_data['date'].dt.floor('D'))['transaction_amount'].sum().reset_index(),
         x='date',
         y='transaction_amount',
         title='Sales Trends Over Day',
         color_discrete_sequence=[color_palette['primary']]
     )
     sales_over_day_fig.update_layout(plot_bgcolor=color_palette['background'])
+    return sales_over_day_fig
 
+def create_sales_over_week_fig(filtered_data):
     sales_over_week_fig = px.line(
-        filtered_data.groupby(filtered_data['date'].dt.to_period('W').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
+        filtered_data.groupby(filtered_data['date'].dt.to_period('W').dt.start_time)['transaction_amount'].sum().reset_index(),
         x='date',
         y='transaction_amount',
         title='Sales Trends Over Week',
         color_discrete_sequence=[color_palette['primary']]
     )
     sales_over_week_fig.update_layout(plot_bgcolor=color_palette['background'])
+    return sales_over_week_fig
 
+def create_sales_over_month_fig(filtered_data):
     sales_over_month_fig = px.line(
-        filtered_data.groupby(filtered_data['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
+        filtered_data.groupby(filtered_data['date'].dt.to_period('M').dt.start_time)['transaction_amount'].sum().reset_index(),
         x='date',
         y='transaction_amount',
         title='Sales Trends Over Month',
         color_discrete_sequence=[color_palette['primary']]
     )
     sales_over_month_fig.update_layout(plot_bgcolor=color_palette['background'])
+    return sales_over_month_fig
 
-    monthly_sales = filtered_data.groupby(filtered_data['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index()
+def create_interactive_sales_trends_fig(filtered_data):
+    monthly_sales = filtered_data.groupby(filtered_data['date'].dt.to_period('M').dt.start_time)['transaction_amount'].sum().reset_index()
     monthly_sales['3_month_MA'] = monthly_sales['transaction_amount'].rolling(window=3).mean()
 
     interactive_sales_trends_fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -426,19 +437,46 @@ def update_dashboard(start_date, end_date, transaction_amount_range, quantity_ra
         template='plotly_white'
     )
     interactive_sales_trends_fig.update_layout(plot_bgcolor=color_palette['background'])
+    return interactive_sales_trends_fig
+
+# Only the figure picked in sales-trends-dropdown is built
+sales_trends_builders = {
+    'day': create_sales_over_day_fig,
+    'week': create_sales_over_week_fig,
+    'month': create_sales_over_month_fig,
+    'interactive': create_interactive_sales_trends_fig,
+    'time_of_day': lambda filtered_data: time_of_day_fig
+}
 
-    if selected_sales_trends == 'day':
-        sales_trends_fig = sales_over_day_fig
-    elif selected_sales_trends == 'week':
-        sales_trends_fig = sales_over_week_fig
-    elif selected_sales_trends == 'month':
-        sales_trends_fig = sales_over_month_fig
-    elif selected_sales_trends == 'interactive':
-        sales_trends_fig = interactive_sales_trends_fig
-    elif selected_sales_trends == 'time_of_day':
-        sales_trends_fig = time_of_day_fig
-
-    return sales_trends_fig, filtered_data.to_dict('records')
+@app.callback(
+    Output("sales-trends-over-time", "figure"),
+    [Input("date-range", "start_date"),
+     Input("date-range", "end_date"),
+     Input("transaction-amount-slider", "value"),
+     Input("quantity-slider", "value"),
+     Input("item-type-dropdown", "value"),
+     Input("item-name-dropdown", "value"),
+     Input("payment-method-dropdown", "value"),
+     Input("sales-trends-dropdown", "value")]
+)
+def update_sales_trends(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, selected_sales_trends):
+    filtered_data = filter_sales_data(*make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods))
+    return sales_trends_builders[selected_sales_trends](filtered_data)
+
+# The table does not depend on sales-trends-dropdown, so switching the trend view leaves it alone
+@app.callback(
+    Output("data-table", "data"),
+    [Input("date-range", "start_date"),
+     Input("date-range", "end_date"),
+     Input("transaction-amount-slider", "value"),
+     Input("quantity-slider", "value"),
+     Input("item-type-dropdown", "value"),
+     Input("item-name-dropdown", "value"),
+     Input("payment-method-dropdown", "value")]
+)
+def update_data_table(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    filtered_data = filter_sales_data(*make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods))
+    return filtered_data.to_dict('records')
 
 @app.callback(
     Output("download-dataframe-csv", "data"),
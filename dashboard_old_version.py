@@ -1,62 +1,147 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import dcc, html, Dash
+from dash import dcc, html, Dash, Patch, ctx
 from dash.dependencies import Input, Output
 from dash import dash_table
-from plotly.subplots import make_subplots
+
+from sales_data_cache import load_sales_data, parse_dates
 
 # Load the dataset
 file_path = 'Balaji Fast Food Sales.csv'
-sales_over_time = pd.read_csv(file_path)
-
-# Ensure sales_over_time['date'] is in datetime format
-def parse_date(date_str):
-    for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y'):
-        try:
-            return pd.to_datetime(date_str, format=fmt)
-        except ValueError:
-            pass
-    return pd.to_datetime(date_str, errors='coerce')
-
-sales_over_time['date'] = sales_over_time['date'].apply(parse_date)
+parquet_stem = 'Balaji Fast Food Sales.old_version'
+
+# Explicit column types, so the text columns are read straight into categoricals without dtype inference;
+# the numeric columns are stored as 32-bit, as in the other dashboards
+csv_dtypes = {
+    'item_name': 'category',
+    'item_type': 'category',
+    'transaction_type': 'category',
+    'received_by': 'category',
+    'time_of_sale': 'category',
+    'quantity': 'int32',
+    'transaction_amount': 'float32'
+}
 
-# Drop rows with invalid dates
-sales_over_time = sales_over_time.dropna(subset=['date'])
-
-# Extract month and year for filtering
-sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str)
-
-# Ensure 'time_of_sale' has the correct order
 time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
-sales_over_time['time_of_sale'] = pd.Categorical(sales_over_time['time_of_sale'], categories=time_of_sale_order, ordered=True)
 
-# Drop rows with null transaction types
-sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
-
-# Ensure transaction_type has no leading/trailing spaces
-sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip()
+def load_sales_csv(file_path):
+    # The multithreaded pyarrow CSV reader is used when pyarrow is installed
+    try:
+        sales_over_time = pd.read_csv(file_path, engine='pyarrow', dtype=csv_dtypes)
+    except ImportError:
+        sales_over_time = pd.read_csv(file_path, dtype=csv_dtypes)
+
+    sales_over_time['date'] = parse_dates(sales_over_time['date'])
+
+    # Drop rows with invalid dates
+    sales_over_time = sales_over_time.dropna(subset=['date'])
+
+    # Extract month and year for filtering
+    sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M')
+
+    # Ensure 'time_of_sale' has the correct order
+    sales_over_time['time_of_sale'] = pd.Categorical(sales_over_time['time_of_sale'], categories=time_of_sale_order, ordered=True)
+
+    # Drop rows with null transaction types
+    sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
+
+    # Ensure transaction_type has no leading/trailing spaces
+    sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip()
+
+    # Low-cardinality text columns are stored as categoricals so masks and groupbys compare integer codes, not strings
+    for column in ['item_name', 'item_type', 'transaction_type', 'received_by']:
+        sales_over_time[column] = sales_over_time[column].astype('category')
+
+    # Sort by date once so every month's rows are contiguous and the month filter is a slice
+    return sales_over_time.sort_values('date', kind='stable').reset_index(drop=True)
+
+# The cleaned dataset is cached as Parquet next to the CSV, so later starts skip the CSV and date parsing;
+# see sales_data_cache for when the cache is rebuilt
+sales_over_time = load_sales_data(file_path, parquet_stem, load_sales_csv, memory_map=True)
+
+# year_month stays a monthly Period column; its int64 ordinals (months since 1970-01) are what the callback compares
+month_periods = sales_over_time['year_month'].array
+month_values = month_periods.asi8
+month_starts = np.flatnonzero(np.r_[True, month_values[1:] != month_values[:-1]])
+month_stops = np.r_[month_starts[1:], len(month_values)]
+# Keyed by the 'YYYY-MM' labels the month dropdown sends
+month_row_slices = {str(month_periods[start]): slice(start, stop) for start, stop in zip(month_starts, month_stops)}
+month_row_slices['All the time'] = slice(0, len(sales_over_time))
+# The amounts are widened once here, so the monthly and per-category sums accumulate in float64
+transaction_amount_values = sales_over_time['transaction_amount'].to_numpy(dtype=np.float64)
+
+# Only the columns the item panels group and sum are copied when the rows are filtered
+panel_columns = sales_over_time[['item_name', 'item_type', 'time_of_sale', 'quantity']]
+
+# The rows are sorted by date, so each month's selected rows are one run and reduceat sums every run in a single pass.
+# The month ordinals are cast straight to month-start timestamps, with no label parsing.
+def monthly_totals(months, amounts):
+    run_starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]]) if len(months) else np.array([], dtype=np.intp)
+    return pd.DataFrame({
+        'year_month': months[run_starts].astype('datetime64[M]').astype('datetime64[ns]'),
+        'transaction_amount': np.add.reduceat(amounts, run_starts) if len(run_starts) else np.array([], dtype=np.float64)
+    })
+
+category_codes = {column: sales_over_time[column].cat.codes.to_numpy() for column in ['transaction_type', 'received_by']}
+
+# Sum the selected rows' amounts per category code in one bincount pass; like groupby, missing values (code -1)
+# are left out and only the categories that occur are kept
+def category_amount_totals(column, codes, amounts):
+    labels = sales_over_time[column].cat.categories
+    present = codes >= 0
+    counts = np.bincount(codes[present], minlength=len(labels))
+    sums = np.bincount(codes[present], weights=amounts[present], minlength=len(labels))
+    return pd.DataFrame({column: labels[counts > 0], 'transaction_amount': sums[counts > 0]})
+
+# One boolean row mask per value of each dropdown-filtered column, built once so the callback filters with OR/AND instead of isin
+filter_row_masks = {
+    column: {value: (sales_over_time[column] == value).to_numpy() for value in sales_over_time[column].dropna().unique()}
+    for column in ['transaction_type', 'time_of_sale', 'item_type', 'item_name']
+}
+
+# The value masks are cut to the selected month's rows before they are combined
+def selected_rows(column, selected_values, month_rows):
+    value_masks = [filter_row_masks[column][value][month_rows] for value in selected_values if value in filter_row_masks[column]]
+    if not value_masks:
+        return np.zeros(month_rows.stop - month_rows.start, dtype=bool)
+    return np.logical_or.reduce(value_masks)
 
 # Group data by payment method
-payment_method_revenue = sales_over_time.groupby('transaction_type').agg({
+payment_method_revenue = sales_over_time.groupby('transaction_type', observed=True).agg({
     'transaction_amount': 'sum'
 }).reset_index()
 
 # Group data by staff gender and calculate total sales amount
-staff_performance = sales_over_time.groupby('received_by').agg({
+staff_performance = sales_over_time.groupby('received_by', observed=True).agg({
     'transaction_amount': 'sum'
 }).reset_index()
 
 # Group data by item name, item type, and year_month
-item_sales = sales_over_time.groupby(['item_name', 'item_type', 'year_month']).agg({
+item_sales = sales_over_time.groupby(['item_name', 'item_type', 'year_month'], observed=True).agg({
     'quantity': 'sum'
 }).reset_index()
 
 # Group data by item name and item type for initial display
-initial_grouped_data = sales_over_time.groupby(['item_name', 'item_type']).agg({
+initial_grouped_data = sales_over_time.groupby(['item_name', 'item_type'], observed=True).agg({
     'quantity': 'sum'
 }).reset_index()
 
+# Dropdown options, built once at import time with one unique() pass per column
+item_types = sales_over_time['item_type'].dropna().unique().tolist()
+item_names = sales_over_time['item_name'].dropna().unique().tolist()
+payment_methods = sales_over_time['transaction_type'].dropna().unique().tolist()
+month_options = [{'label': 'All the time', 'value': 'All the time'}] + \
+                [{'label': month, 'value': month} for month in month_row_slices if month != 'All the time']
+time_of_sale_options = [{'label': time, 'value': time} for time in time_of_sale_order]
+item_type_options = [{'label': item_type, 'value': item_type} for item_type in item_types]
+item_name_options = [{'label': name, 'value': name} for name in item_names]
+payment_options = [{'label': method, 'value': method} for method in payment_methods]
+
 # Create the Dash app
 app = Dash(__name__)
 
@@ -67,8 +152,7 @@ app.layout = html.Div([
         html.Label('Filter by Month'),
         dcc.Dropdown(
             id='month-filter',
-            options=[{'label': 'All the time', 'value': 'All the time'}] +
-                    [{'label': str(month), 'value': str(month)} for month in sales_over_time['year_month'].unique()],
+            options=month_options,
             value='All the time',
             clearable=False,
             style={'width': '400px', 'margin-bottom': '10px'}
@@ -80,7 +164,7 @@ app.layout = html.Div([
         html.Label('Filter by Time of Sale'),
         dcc.Dropdown(
             id='time-of-sale-filter',
-            options=[{'label': time, 'value': time} for time in time_of_sale_order],
+            options=time_of_sale_options,
             value=time_of_sale_order,
             multi=True,
             clearable=False,
@@ -93,8 +177,8 @@ app.layout = html.Div([
         html.Label('Filter by Item Type'),
         dcc.Dropdown(
             id='item-type-filter',
-            options=[{'label': item_type, 'value': item_type} for item_type in sales_over_time['item_type'].unique()],
-            value=sales_over_time['item_type'].unique().tolist(),
+            options=item_type_options,
+            value=item_types,
             multi=True,
             clearable=False,
             style={'width': '400px', 'margin-bottom': '10px'}
@@ -106,8 +190,8 @@ app.layout = html.Div([
         html.Label('Filter by Item Name'),
         dcc.Dropdown(
             id='item-name-filter',
-            options=[{'label': name, 'value': name} for name in sales_over_time['item_name'].unique()],
-            value=sales_over_time['item_name'].unique().tolist(),
+            options=item_name_options,
+            value=item_names,
             multi=True,
             clearable=False,
             style={'width': '400px', 'margin-bottom': '10px'}
@@ -118,8 +202,8 @@ app.layout = html.Div([
         html.Label('Filter by Payment Method'),
         dcc.Dropdown(
             id='payment-filter',
-            options=[{'label': method, 'value': method} for method in sales_over_time['transaction_type'].unique()],
-            value=sales_over_time['transaction_type'].unique().tolist(),
+            options=payment_options,
+            value=payment_methods,
             multi=True,
             clearable=False,
             style={'width': '400px', 'margin-bottom': '10px'}
@@ -137,6 +221,9 @@ app.layout = html.Div([
     dash_table.DataTable(
         id='data-table',
         columns=[{"name": i, "id": i} for i in sales_over_time.columns],
+        # Pages are sliced on the server, so only the visible rows are serialized
+        page_action='custom',
+        page_current=0,
         page_size=10,
         style_table={'height': '400px', 'overflowY': 'auto'},
         style_cell={'textAlign': 'left', 'padding': '5px'},
@@ -144,46 +231,55 @@ app.layout = html.Div([
     )
 ])
 
-@app.callback(
-    [Output('sales-trends-line-chart', 'figure'),
-     Output('payment-method-pie-chart', 'figure'),
-     Output('staff-performance-bar-chart', 'figure'),
-     Output('item-preferences-bar-chart', 'figure'),
-     Output('heatmap', 'figure'),
-     Output('data-table', 'data')],
-    [Input('payment-filter', 'value'),
-     Input('month-filter', 'value'),
-     Input('time-of-sale-filter', 'value'),
-     Input('item-type-filter', 'value'),
-     Input('item-name-filter', 'value')]
-)
-def update_dashboard(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names):
-    filtered_data = sales_over_time[sales_over_time['transaction_type'].isin(selected_payment_methods)]
-
-    if selected_month != 'All the time':
-        filtered_data = filtered_data[filtered_data['year_month'] == selected_month]
-
-    filtered_data = filtered_data[filtered_data['time_of_sale'].isin(selected_times)]
-    filtered_data = filtered_data[filtered_data['item_type'].isin(selected_item_types)]
-    filtered_data = filtered_data[filtered_data['item_name'].isin(selected_item_names)]
-
-    # Sales Trends Over Time
-    monthly_sales = filtered_data.groupby('year_month').agg({
-        'transaction_amount': 'sum'
-    }).reset_index()
-    monthly_sales['year_month'] = pd.to_datetime(monthly_sales['year_month'], format='%Y-%m')
-    monthly_sales['3month_moving_average'] = monthly_sales['transaction_amount'].rolling(window=3).mean()
-
-    # Create a figure for sales trends
-    sales_trends_fig = make_subplots(specs=[[{"secondary_y": False}]])
-    sales_trends_fig.add_trace(
+# Trailing 3-month mean; the first two months have no full window, as with rolling(window=3).
+# bottleneck's C kernel is used when it is installed, otherwise pandas' rolling mean
+try:
+    from bottleneck import move_mean
+
+    def three_month_moving_average(values):
+        return move_mean(values, window=3)
+except ImportError:
+    def three_month_moving_average(values):
+        return pd.Series(values).rolling(window=3).mean().to_numpy()
+
+# Fixed colors of the staff bars and legend order of the item types
+staff_colors = {'Mr.': 'skyblue', 'Mrs.': 'salmon'}
+item_type_legend_order = ['Fastfood', 'Beverages']
+
+# Layout entries of each figure that change with the filter selection, in output order;
+# every other layout entry is the same for any selection
+figure_data_layout_keys = [
+    ['xaxis', 'yaxis', 'annotations'],  # sales trends
+    [],  # payment methods
+    [],  # staff performance
+    [],  # customer preferences
+    []  # heatmap
+]
+
+# The rows picked by a filter selection, with the per-row arrays and item totals every panel reads from
+def build_selection(month_rows, mask):
+    # The item panels are grouped once by every key they use; each then sums this small frame.
+    # Missing keys are kept here, so each panel still drops only the rows missing its own keys.
+    item_totals = panel_columns.iloc[month_rows][mask].groupby(['item_name', 'item_type', 'time_of_sale'], observed=True, dropna=False).agg(
+        quantity=('quantity', 'sum')
+    ).reset_index()
+    return {
+        'month_rows': month_rows,
+        'mask': mask,
+        'amounts': transaction_amount_values[month_rows][mask],
+        'item_totals': item_totals
+    }
+
+# Sales Trends Over Time
+def create_sales_trends_figure(selection):
+    monthly_sales = monthly_totals(month_values[selection['month_rows']][selection['mask']], selection['amounts'])
+    monthly_sales['3month_moving_average'] = three_month_moving_average(monthly_sales['transaction_amount'].to_numpy())
+
+    # Create a figure for sales trends with the monthly sales and 3-month Moving Average traces
+    sales_trends_fig = go.Figure(data=[
         go.Scatter(x=monthly_sales['year_month'], y=monthly_sales['transaction_amount'], mode='lines+markers', name='Monthly Sales'),
-        secondary_y=False,
-    )
-    sales_trends_fig.add_trace(
-        go.Scatter(x=monthly_sales['year_month'], y=monthly_sales['3month_moving_average'], mode='lines', name='3-month Moving Average'),
-        secondary_y=False,
-    )
+        go.Scatter(x=monthly_sales['year_month'], y=monthly_sales['3month_moving_average'], mode='lines', name='3-month Moving Average')
+    ])
     max_month = monthly_sales.loc[monthly_sales['transaction_amount'].idxmax()]['year_month']
     max_amount = monthly_sales['transaction_amount'].max()
     sales_trends_fig.add_annotation(
@@ -214,38 +310,37 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         )
     )
 
-    # Payment Methods
-    payment_method_revenue = filtered_data.groupby('transaction_type').agg({
-        'transaction_amount': 'sum'
-    }).reset_index()
-    payment_method_fig = px.pie(
-        payment_method_revenue,
-        names='transaction_type',
-        values='transaction_amount',
-        hover_data={'transaction_type': True, 'transaction_amount': True},
-        labels={'transaction_type': 'Payment Method', 'transaction_amount': 'Total Revenue'},
-        title='Impact of Payment Methods on Revenue'
-    )
+    return sales_trends_fig
+
+# Payment Methods
+def create_payment_method_figure(selection):
+    payment_method_revenue = category_amount_totals('transaction_type', category_codes['transaction_type'][selection['month_rows']][selection['mask']], selection['amounts'])
+    payment_method_fig = go.Figure(go.Pie(
+        labels=payment_method_revenue['transaction_type'].to_numpy(),
+        values=payment_method_revenue['transaction_amount'].to_numpy(),
+        hovertemplate='Payment Method=%{label}<br>Total Revenue=%{value}<extra></extra>'
+    ))
     payment_method_fig.update_layout(
+        title_text='Impact of Payment Methods on Revenue',
         template='plotly_white',
         title_font=dict(size=24, family='Arial', color='black'),
         font=dict(family='Arial', size=14, color='black')
     )
 
-    # Staff Performance
-    filtered_staff_performance = filtered_data.groupby('received_by').agg({
-        'transaction_amount': 'sum'
-    }).reset_index()
-    staff_performance_fig = px.bar(
-        filtered_staff_performance, 
-        x='received_by', 
-        y='transaction_amount', 
-        color='received_by',
-        labels={'received_by': 'Staff Gender', 'transaction_amount': 'Total Sales Amount'},
-        title='Total Sales Amount by Staff Gender',
-        color_discrete_map={'Mr.': 'skyblue', 'Mrs.': 'salmon'}
-    )
+    return payment_method_fig
+
+# Staff Performance
+def create_staff_performance_figure(selection):
+    filtered_staff_performance = category_amount_totals('received_by', category_codes['received_by'][selection['month_rows']][selection['mask']], selection['amounts'])
+    # One bar trace with a color per staff gender; the legend is hidden, so px's one-trace-per-color split is not needed
+    staff_performance_fig = go.Figure(go.Bar(
+        x=filtered_staff_performance['received_by'].to_numpy(),
+        y=filtered_staff_performance['transaction_amount'].to_numpy(),
+        marker_color=[staff_colors.get(staff, px.colors.qualitative.Plotly[0]) for staff in filtered_staff_performance['received_by']],
+        hovertemplate='Staff Gender=%{x}<br>Total Sales Amount=%{y}<extra></extra>'
+    ))
     staff_performance_fig.update_layout(
+        title_text='Total Sales Amount by Staff Gender',
         template='plotly_white',
         title_font=dict(size=24, family='Arial', color='black'),
         xaxis_title='Staff Gender',
@@ -254,21 +349,31 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         showlegend=False
     )
 
-    # Customer Preferences
-    grouped_data = filtered_data.groupby(['item_name', 'item_type']).agg({
+    return staff_performance_fig
+
+# Customer Preferences
+def create_item_preferences_figure(selection):
+    grouped_data = selection['item_totals'].groupby(['item_name', 'item_type'], observed=True).agg({
         'quantity': 'sum'
     }).reset_index()
-    item_preferences_fig = px.bar(
-        grouped_data,
-        x='item_name',
-        y='quantity',
-        color='item_type',
-        hover_data={'item_name': True, 'quantity': True},
-        labels={'item_name': 'Item Name', 'quantity': 'Quantity Sold'},
-        title='Customer Preferences for Different Items',
-        category_orders={'item_type': ['Fastfood', 'Beverages']}
-    )
+    # One bar trace per item type, Fastfood first, as px.bar's color= grouping drew them
+    item_types_present = grouped_data['item_type'].dropna().unique().tolist()
+    item_type_order = [t for t in item_type_legend_order if t in item_types_present] + \
+                      [t for t in item_types_present if t not in item_type_legend_order]
+    item_preferences_fig = go.Figure([
+        go.Bar(
+            x=grouped_data.loc[grouped_data['item_type'] == item_type, 'item_name'].to_numpy(),
+            y=grouped_data.loc[grouped_data['item_type'] == item_type, 'quantity'].to_numpy(),
+            name=item_type,
+            legendgroup=item_type,
+            marker_color=px.colors.qualitative.Plotly[i % len(px.colors.qualitative.Plotly)],
+            hovertemplate='<b>Item Name:</b> %{x}<br><b>Quantity Sold:</b> %{y}<extra></extra>'
+        )
+        for i, item_type in enumerate(item_type_order)
+    ])
     item_preferences_fig.update_layout(
+        title_text='Customer Preferences for Different Items',
+        barmode='relative',
         template='plotly_white',
         title_font=dict(size=24, family='Arial', color='black'),
         xaxis_title='Item Name',
@@ -276,20 +381,18 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         legend_title='Item Type',
         font=dict(family='Arial', size=14, color='black')
     )
-    item_preferences_fig.update_traces(
-        hovertemplate='<b>Item Name:</b> %{x}<br><b>Quantity Sold:</b> %{y}<extra></extra>'
-    )
 
-    # Popularity of Items at Different Times of the Day
-    filtered_heatmap_data = filtered_data.pivot_table(
-        index='time_of_sale', 
-        columns='item_name', 
-        values='quantity', 
-        aggfunc='sum',
-        fill_value=0,
-        observed=False
+    return item_preferences_fig
+
+# Popularity of Items at Different Times of the Day
+def create_heatmap_figure(selection):
+    # Long form straight from the groupby; reindexing over every time of sale and sold item fills the empty cells with 0
+    heatmap_cells = pd.MultiIndex.from_product(
+        [time_of_sale_order, selection['item_totals']['item_name'].cat.remove_unused_categories().cat.categories],
+        names=['time_of_sale', 'item_name']
     )
-    filtered_heatmap_data = filtered_heatmap_data.reset_index().melt(id_vars='time_of_sale', value_vars=filtered_heatmap_data.columns)
+    filtered_heatmap_data = selection['item_totals'].groupby(['time_of_sale', 'item_name'], observed=True)['quantity'].sum() \
+        .reindex(heatmap_cells, fill_value=0).reset_index(name='value')
     heatmap_fig = px.density_heatmap(
         filtered_heatmap_data, 
         x='item_name', 
@@ -308,8 +411,115 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         font=dict(family='Arial', size=14, color='black')
     )
 
-    return (sales_trends_fig, payment_method_fig, staff_performance_fig, 
-            item_preferences_fig, heatmap_fig, filtered_data.to_dict('records'))
+    return heatmap_fig
+
+# Figure builders in output order
+figure_builders = [
+    create_sales_trends_figure,
+    create_payment_method_figure,
+    create_staff_performance_figure,
+    create_item_preferences_figure,
+    create_heatmap_figure
+]
+
+# The panels only read the selection and the startup arrays, so they are built side by side on a thread pool
+figure_executor = ThreadPoolExecutor(max_workers=len(figure_builders))
+
+def create_figure_dict(create_figure, selection):
+    return create_figure(selection).to_dict()
+
+# Plotly fills in its shared template objects lazily, and that first pass is not thread-safe,
+# so every panel is built once on this thread before the pool ever runs two of them together
+all_rows_selection = build_selection(month_row_slices['All the time'], np.ones(len(sales_over_time), dtype=bool))
+for create_figure in figure_builders:
+    create_figure(all_rows_selection)
+
+# Dash passes lists; sort them into tuples so equivalent selections share a cache entry
+def make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names):
+    return (
+        tuple(sorted(selected_payment_methods)),
+        selected_month,
+        tuple(sorted(selected_times)),
+        tuple(sorted(selected_item_types)),
+        tuple(sorted(selected_item_names))
+    )
+
+# The month's row block and the mask of its selected rows, cached so the figures and the table share them
+@lru_cache(maxsize=256)
+def build_filter_rows(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names):
+    # The month picks a contiguous block of rows first, so the other filters only touch that month
+    month_rows = month_row_slices.get(selected_month, slice(0, 0))
+    selected_values = {
+        'transaction_type': selected_payment_methods,
+        'time_of_sale': selected_times,
+        'item_type': selected_item_types,
+        'item_name': selected_item_names
+    }
+
+    mask = np.logical_and.reduce([selected_rows(column, values, month_rows) for column, values in selected_values.items()])
+    return month_rows, mask
+
+# Build every figure for a filter selection, cached so toggling back to a previous selection skips the rebuild.
+# Figures are stored as plain dicts, which Dash serializes without re-validating them.
+@lru_cache(maxsize=256)
+def build_dashboard_outputs(filter_key):
+    selection = build_selection(*build_filter_rows(*filter_key))
+
+    figure_futures = [figure_executor.submit(create_figure_dict, create_figure, selection) for create_figure in figure_builders]
+    return tuple(future.result() for future in figure_futures)
+
+@app.callback(
+    [Output('sales-trends-line-chart', 'figure'),
+     Output('payment-method-pie-chart', 'figure'),
+     Output('staff-performance-bar-chart', 'figure'),
+     Output('item-preferences-bar-chart', 'figure'),
+     Output('heatmap', 'figure')],
+    [Input('payment-filter', 'value'),
+     Input('month-filter', 'value'),
+     Input('time-of-sale-filter', 'value'),
+     Input('item-type-filter', 'value'),
+     Input('item-name-filter', 'value')]
+)
+def update_dashboard(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names):
+    outputs = build_dashboard_outputs(make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names))
+
+    # The figures are only sent in full on the first render
+    if ctx.triggered_id is None:
+        return outputs
+
+    # A filter change keeps every chart, so only their traces and data-dependent layout are patched;
+    # the titles, fonts and template stay in the browser
+    figure_patches = []
+    for figure, layout_keys in zip(outputs, figure_data_layout_keys):
+        patch = Patch()
+        patch['data'] = figure['data']
+        for key in layout_keys:
+            if key in figure['layout']:
+                patch['layout'][key] = figure['layout'][key]
+        figure_patches.append(patch)
+    return figure_patches
+
+@app.callback(
+    [Output('data-table', 'data'),
+     Output('data-table', 'page_count')],
+    [Input('payment-filter', 'value'),
+     Input('month-filter', 'value'),
+     Input('time-of-sale-filter', 'value'),
+     Input('item-type-filter', 'value'),
+     Input('item-name-filter', 'value'),
+     Input('data-table', 'page_current'),
+     Input('data-table', 'page_size')]
+)
+def update_data_table(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, page_current, page_size):
+    month_rows, mask = build_filter_rows(*make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names))
+
+    # Only the rows of the current page are converted to records
+    filtered_rows = month_rows.start + np.flatnonzero(mask)
+    page_rows = filtered_rows[page_current * page_size:(page_current + 1) * page_size]
+    page_count = max(1, -(-len(filtered_rows) // page_size))
+
+    page_data = sales_over_time.iloc[page_rows]
+    return page_data.assign(year_month=page_data['year_month'].astype(str)).to_dict('records'), page_count
 
 if __name__ == '__main__':
     app.run_server(debug=True)
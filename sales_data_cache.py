@@ -0,0 +1,84 @@
+import glob
+import hashlib
+import inspect
+import os
+import tempfile
+import warnings
+
+import pandas as pd
+
+schema_token_length = 10
+
+# Failures the cache falls back to the CSV on: no Parquet engine, an unreadable or unwritable file,
+# or a file pyarrow cannot parse. Anything else is a bug and is raised.
+try:
+    from pyarrow import ArrowException
+    parquet_cache_errors = (ImportError, OSError, ArrowException)
+except ImportError:
+    parquet_cache_errors = (ImportError, OSError)
+
+# A missing Parquet engine is the expected way to run without the cache; other failures are reported
+def warn_cache_error(action, parquet_path, error):
+    if not isinstance(error, ImportError):
+        warnings.warn(f'Could not {action} the Parquet cache {parquet_path!r}, using the CSV: {error}')
+
+# Dates in the CSV come in several layouts; each known format is parsed over the whole column
+# and later formats only fill the dates still missing
+def parse_dates(date_series):
+    parsed = pd.to_datetime(date_series, format='%Y-%m-%d', errors='coerce')
+    for fmt in ('%m/%d/%Y', '%d-%m-%Y'):
+        parsed = parsed.fillna(pd.to_datetime(date_series, format=fmt, errors='coerce'))
+    return parsed.fillna(pd.to_datetime(date_series, format='mixed', errors='coerce'))
+
+# Token for the shape of the cleaned dataset, hashed from the source of the loader's whole module and of this one,
+# so a change to the loader or anything it reads (column types, date parsing, category orders) starts a fresh cache
+def schema_token(load_csv):
+    source = inspect.getsource(inspect.getmodule(load_csv)) + inspect.getsource(inspect.getmodule(schema_token))
+    return hashlib.sha1(source.encode()).hexdigest()[:schema_token_length]
+
+# Load the cleaned dataset, cached as Parquet next to the CSV so later starts skip the CSV and date parsing.
+# The cache file is named '<parquet_stem>.<schema token>.parquet' and is only used when it is newer than the CSV.
+# A failure to read or write the cache (no pyarrow, a read-only directory, a corrupt file) falls back to the CSV.
+def load_sales_data(file_path, parquet_stem, load_csv, **read_options):
+    parquet_path = f'{parquet_stem}.{schema_token(load_csv)}.parquet'
+
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(file_path):
+        try:
+            return pd.read_parquet(parquet_path, **read_options)
+        except parquet_cache_errors as error:
+            warn_cache_error('read', parquet_path, error)
+
+    sales_over_time = load_csv(file_path)
+    write_parquet_cache(sales_over_time, parquet_path, parquet_stem)
+    return sales_over_time
+
+# The cache is written to a temporary file and moved into place, so a crash mid-write never leaves a partial
+# file under the real name; caches from older schemas are removed once the new one is in place
+def write_parquet_cache(sales_over_time, parquet_path, parquet_stem):
+    directory = os.path.dirname(os.path.abspath(parquet_path))
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(parquet_stem) + '.', suffix='.parquet.tmp')
+    except OSError as error:
+        warn_cache_error('write', parquet_path, error)
+        return
+    os.close(fd)
+    try:
+        sales_over_time.to_parquet(temp_path)
+        os.replace(temp_path, parquet_path)
+    except parquet_cache_errors as error:
+        warn_cache_error('write', parquet_path, error)
+        return
+    finally:
+        # Only left behind when the write failed; after os.replace the temporary name is gone
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    for stale_path in glob.glob(glob.escape(parquet_stem) + '.' + '?' * schema_token_length + '.parquet'):
+        if os.path.abspath(stale_path) != os.path.abspath(parquet_path):
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
@@ -1,69 +1,166 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import dcc, html, Dash
+from dash import dcc, html, Dash, Patch, ctx
 from dash.dependencies import Input, Output, State
 from dash import dash_table
-from plotly.subplots import make_subplots
-import io
-import base64
+
+from sales_data_cache import load_sales_data, parse_dates
 
 # Load the dataset
 file_path = 'Balaji Fast Food Sales.csv'
-sales_over_time = pd.read_csv(file_path)
+parquet_stem = 'Balaji Fast Food Sales.single_diagram'
+
+# Low-cardinality text columns are read straight into categoricals so filters and groupbys work on integer codes;
+# the numeric columns are read as 32-bit to halve the bytes every mask and sum touches
+csv_dtypes = {
+    'item_name': 'category',
+    'item_type': 'category',
+    'transaction_type': 'category',
+    'received_by': 'category',
+    'time_of_sale': 'category',
+    'quantity': 'int32',
+    'transaction_amount': 'float32'
+}
 
-# Ensure sales_over_time['date'] is in datetime format
-def parse_date(date_str):
-    for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y'):
-        try:
-            return pd.to_datetime(date_str, format=fmt)
-        except ValueError:
-            pass
-    return pd.to_datetime(date_str, errors='coerce')
+time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
 
-sales_over_time['date'] = sales_over_time['date'].apply(parse_date)
+def load_sales_csv(file_path):
+    # The multithreaded pyarrow CSV reader is used when pyarrow is installed
+    try:
+        sales_over_time = pd.read_csv(file_path, engine='pyarrow', dtype=csv_dtypes)
+    except ImportError:
+        sales_over_time = pd.read_csv(file_path, dtype=csv_dtypes)
 
-# Drop rows with invalid dates
-sales_over_time = sales_over_time.dropna(subset=['date'])
+    sales_over_time['date'] = parse_dates(sales_over_time['date'])
 
-# Extract month and year for filtering
-sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str)
+    # Drop rows with invalid dates
+    sales_over_time = sales_over_time.dropna(subset=['date'])
 
-# Ensure 'time_of_sale' has the correct order
-time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
-sales_over_time['time_of_sale'] = pd.Categorical(sales_over_time['time_of_sale'], categories=time_of_sale_order, ordered=True)
+    # Extract month and year for filtering
+    sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str).astype('category')
+
+    # Ensure 'time_of_sale' has the correct order
+    sales_over_time['time_of_sale'] = sales_over_time['time_of_sale'].cat.set_categories(time_of_sale_order, ordered=True)
+
+    # Drop rows with null transaction types
+    sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
+
+    # Ensure transaction_type has no leading/trailing spaces
+    sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip().astype('category')
+
+    # Sort once so rows of the same month, time of sale and item sit next to each other for the masked sums
+    return sales_over_time.sort_values(['year_month', 'time_of_sale', 'item_name'], kind='stable').reset_index(drop=True)
+
+# The cleaned dataset is cached as Parquet next to the CSV, so later starts skip the CSV and date parsing;
+# see sales_data_cache for when the cache is rebuilt
+sales_over_time = load_sales_data(file_path, parquet_stem, load_sales_csv)
 
-# Drop rows with null transaction types
-sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
+# One boolean row mask per value of each dropdown-filtered column, so the callback filters with OR/AND instead of isin
+def value_row_masks(column):
+    codes, values = pd.factorize(sales_over_time[column])
+    return {value: codes == i for i, value in enumerate(values)}
 
-# Ensure transaction_type has no leading/trailing spaces
-sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip()
+filter_row_masks = {column: value_row_masks(column) for column in ['transaction_type', 'year_month', 'time_of_sale', 'item_type', 'item_name']}
 
-# Group data by payment method
-payment_method_revenue = sales_over_time.groupby('transaction_type').agg({
-    'transaction_amount': 'sum'
-}).reset_index()
+def selected_rows(column, selected_values):
+    mask = np.zeros(len(sales_over_time), dtype=bool)
+    for value in selected_values:
+        if value in filter_row_masks[column]:
+            mask |= filter_row_masks[column][value]
+    return mask
 
-# Group data by staff gender and calculate total sales amount
-staff_performance = sales_over_time.groupby('received_by').agg({
-    'transaction_amount': 'sum'
-}).reset_index()
+# Columns where every row has a value, so selecting all of their values keeps every row and the filter can be skipped
+complete_filter_columns = {column for column in filter_row_masks if sales_over_time[column].notna().all()}
 
-# Group data by item name, item type, and year_month
-item_sales = sales_over_time.groupby(['item_name', 'item_type', 'year_month']).agg({
-    'quantity': 'sum',
-    'transaction_amount': 'sum'
-}).reset_index()
+def selects_all_rows(column, selected_values):
+    return column in complete_filter_columns and set(filter_row_masks[column]) <= set(selected_values)
 
-# Group data by item name and item type for initial display
-initial_grouped_data = sales_over_time.groupby(['item_name', 'item_type']).agg({
-    'quantity': 'sum',
-    'transaction_amount': 'sum'
-}).reset_index()
+transaction_amount_values = sales_over_time['transaction_amount'].to_numpy()
+quantity_values = sales_over_time['quantity'].to_numpy()
+
+# Slider bounds, scanned once here for both the slider definitions and the callback's full-range check
+transaction_amount_min, transaction_amount_max = transaction_amount_values.min().item(), transaction_amount_values.max().item()
+quantity_min, quantity_max = quantity_values.min().item(), quantity_values.max().item()
+
+def covers_all_values(selected_range, value_range):
+    return selected_range[0] <= value_range[0] and selected_range[1] >= value_range[1]
+
+# Group codes for the callback's groupings, factorized once at startup.
+# Summing the rows selected by the filter mask per code gives the same totals as groupby(...).agg('sum') on the filtered frame.
+# With count_column set, the number of selected rows per group is added as well, like groupby(...).size().
+def build_grouping(columns, value_columns, count_column=None):
+    codes, labels = pd.factorize(pd.MultiIndex.from_frame(sales_over_time[columns]), sort=True)
+    return {
+        'labels': labels.to_frame(index=False, name=columns),
+        'codes': codes,
+        'values': {column: sales_over_time[column].to_numpy() for column in value_columns},
+        'count_column': count_column
+    }
+
+# Sum values per group code over the selected rows in one bincount pass
+def masked_group_sum(mask, codes, values, n_groups):
+    return np.bincount(codes[mask], weights=values[mask], minlength=n_groups)
+
+def grouped_totals(grouping, mask):
+    # Rows with a missing key (code -1) belong to no group, as in groupby
+    mask = mask & (grouping['codes'] >= 0)
+    n_groups = len(grouping['labels'])
+
+    # Like groupby, only the groups with at least one selected row are kept
+    counts = np.bincount(grouping['codes'][mask], minlength=n_groups)
+    present = counts > 0
+    totals = grouping['labels'][present].reset_index(drop=True)
+    if grouping['count_column'] is not None:
+        totals[grouping['count_column']] = counts[present]
+    for column, values in grouping['values'].items():
+        column_totals = masked_group_sum(mask, grouping['codes'], values, n_groups)[present]
+        # Integer columns keep integer totals, as groupby sums would
+        if values.dtype.kind in 'iu':
+            column_totals = column_totals.round().astype(np.int64)
+        totals[column] = column_totals
+    return totals
+
+monthly_grouping = build_grouping(['year_month'], ['transaction_amount'])
+# The month labels are turned into timestamps once here instead of being re-parsed on every callback
+monthly_grouping['labels']['year_month'] = pd.to_datetime(monthly_grouping['labels']['year_month'].astype(str), format='%Y-%m')
+payment_grouping = build_grouping(['transaction_type'], ['transaction_amount'])
+staff_grouping = build_grouping(['received_by'], ['transaction_amount'])
+item_type_grouping = build_grouping(['item_name', 'item_type'], ['quantity'])
+item_grouping = build_grouping(['item_name'], ['quantity', 'transaction_amount'])
+
+# Heatmap cell of each row, numbered time of sale major and item minor, so the filtered quantities fold straight into the matrix
+heatmap_items = sales_over_time['item_name'].cat.categories
+heatmap_item_codes = sales_over_time['item_name'].cat.codes.to_numpy()
+heatmap_time_codes = sales_over_time['time_of_sale'].cat.codes.to_numpy()
+heatmap_cell_codes = np.where((heatmap_item_codes >= 0) & (heatmap_time_codes >= 0),
+                              heatmap_time_codes.astype(np.int64) * len(heatmap_items) + heatmap_item_codes, -1)
+sankey_grouping = build_grouping(['item_name', 'item_type', 'transaction_type'], [], count_column='count')
+
+# Dropdown options, built once at import time
+item_types = sales_over_time['item_type'].cat.categories.tolist()
+item_names = sales_over_time['item_name'].cat.categories.tolist()
+payment_methods = sales_over_time['transaction_type'].cat.categories.tolist()
+month_options = [{'label': 'All the time', 'value': 'All the time'}] + \
+                [{'label': str(month), 'value': str(month)} for month in sales_over_time['year_month'].cat.categories]
+time_of_sale_options = [{'label': time, 'value': time} for time in time_of_sale_order]
+item_type_options = [{'label': item_type, 'value': item_type} for item_type in item_types]
+item_name_options = [{'label': name, 'value': name} for name in item_names]
+payment_options = [{'label': method, 'value': method} for method in payment_methods]
 
 # Create the Dash app
 app = Dash(__name__)
 
+# Gzip/Brotli-compress the figure and table JSON responses when flask-compress is installed
+try:
+    from flask_compress import Compress
+    Compress(app.server)
+except ImportError:
+    pass
+
 app.layout = html.Div([
     html.H1('Restaurant Sales Dashboard'),
 
@@ -72,8 +169,7 @@ app.layout = html.Div([
             html.Label('Month'),
             dcc.Dropdown(
                 id='month-filter',
-                options=[{'label': 'All the time', 'value': 'All the time'}] +
-                        [{'label': str(month), 'value': str(month)} for month in sales_over_time['year_month'].unique()],
+                options=month_options,
                 value='All the time',
                 clearable=False,
                 style={'width': '200px', 'margin-bottom': '10px'}
@@ -84,7 +180,7 @@ app.layout = html.Div([
             html.Label('Time of Sale'),
             dcc.Dropdown(
                 id='time-of-sale-filter',
-                options=[{'label': time, 'value': time} for time in time_of_sale_order],
+                options=time_of_sale_options,
                 value=time_of_sale_order,
                 multi=True,
                 clearable=False,
@@ -96,8 +192,8 @@ app.layout = html.Div([
             html.Label('Item Type'),
             dcc.Dropdown(
                 id='item-type-filter',
-                options=[{'label': item_type, 'value': item_type} for item_type in sales_over_time['item_type'].unique()],
-                value=sales_over_time['item_type'].unique().tolist(),
+                options=item_type_options,
+                value=item_types,
                 multi=True,
                 clearable=False,
                 style={'width': '200px', 'margin-bottom': '10px'}
@@ -108,8 +204,8 @@ app.layout = html.Div([
             html.Label('Item Name'),
             dcc.Dropdown(
                 id='item-name-filter',
-                options=[{'label': name, 'value': name} for name in sales_over_time['item_name'].unique()],
-                value=sales_over_time['item_name'].unique().tolist(),
+                options=item_name_options,
+                value=item_names,
                 multi=True,
                 clearable=False,
                 style={'width': '200px', 'margin-bottom': '10px'}
@@ -120,8 +216,8 @@ app.layout = html.Div([
             html.Label('Payment Method'),
             dcc.Dropdown(
                 id='payment-filter',
-                options=[{'label': method, 'value': method} for method in sales_over_time['transaction_type'].unique()],
-                value=sales_over_time['transaction_type'].unique().tolist(),
+                options=payment_options,
+                value=payment_methods,
                 multi=True,
                 clearable=False,
                 style={'width': '200px', 'margin-bottom': '10px'}
@@ -133,12 +229,12 @@ app.layout = html.Div([
         html.Label('Transaction Amount'),
         dcc.RangeSlider(
             id='transaction-amount-slider',
-            min=sales_over_time['transaction_amount'].min(),
-            max=sales_over_time['transaction_amount'].max(),
+            min=transaction_amount_min,
+            max=transaction_amount_max,
             step=1,
-            value=[sales_over_time['transaction_amount'].min(), sales_over_time['transaction_amount'].max()],
-            marks={int(sales_over_time['transaction_amount'].min()): str(int(sales_over_time['transaction_amount'].min())),
-                   int(sales_over_time['transaction_amount'].max()): str(int(sales_over_time['transaction_amount'].max()))}
+            value=[transaction_amount_min, transaction_amount_max],
+            marks={int(transaction_amount_min): str(int(transaction_amount_min)),
+                   int(transaction_amount_max): str(int(transaction_amount_max))}
         ),
     ], style={'margin-bottom': '20px'}),
 
@@ -146,12 +242,12 @@ app.layout = html.Div([
         html.Label('Quantity'),
         dcc.RangeSlider(
             id='quantity-slider',
-            min=sales_over_time['quantity'].min(),
-            max=sales_over_time['quantity'].max(),
+            min=quantity_min,
+            max=quantity_max,
             step=1,
-            value=[sales_over_time['quantity'].min(), sales_over_time['quantity'].max()],
-            marks={int(sales_over_time['quantity'].min()): str(int(sales_over_time['quantity'].min())),
-                   int(sales_over_time['quantity'].max()): str(int(sales_over_time['quantity'].max()))}
+            value=[quantity_min, quantity_max],
+            marks={int(quantity_min): str(int(quantity_min)),
+                   int(quantity_max): str(int(quantity_max))}
         ),
     ], style={'margin-bottom': '20px'}),
 
@@ -181,6 +277,9 @@ app.layout = html.Div([
     dash_table.DataTable(
         id='data-table',
         columns=[{"name": i, "id": i} for i in sales_over_time.columns],
+        # Pages are sliced on the server, so only the visible rows are serialized
+        page_action='custom',
+        page_current=0,
         page_size=10,
         style_table={'height': '400px', 'overflowY': 'auto'},
         style_cell={'textAlign': 'left', 'padding': '5px'},
@@ -191,37 +290,49 @@ app.layout = html.Div([
     dcc.Download(id="download-dataframe-csv")
 ])
 
-@app.callback(
-    [Output('dashboard', 'figure'),
-     Output('data-table', 'data')],
-    [Input('payment-filter', 'value'),
-     Input('month-filter', 'value'),
-     Input('time-of-sale-filter', 'value'),
-     Input('item-type-filter', 'value'),
-     Input('item-name-filter', 'value'),
-     Input('transaction-amount-slider', 'value'),
-     Input('quantity-slider', 'value'),
-     Input('chart-filter', 'value')]
-)
-def update_dashboard(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity, selected_chart):
-    filtered_data = sales_over_time[sales_over_time['transaction_type'].isin(selected_payment_methods)]
-
-    if selected_month != 'All the time':
-        filtered_data = filtered_data[filtered_data['year_month'] == selected_month]
+# Trailing 3-month mean from a cumulative sum; the first two months have no full window, as with rolling(window=3)
+def three_month_moving_average(values):
+    cumulative = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    moving_average = np.full(len(values), np.nan)
+    moving_average[2:] = (cumulative[3:] - cumulative[:-3]) / 3.0
+    return moving_average
 
-    filtered_data = filtered_data[filtered_data['time_of_sale'].isin(selected_times)]
-    filtered_data = filtered_data[filtered_data['item_type'].isin(selected_item_types)]
-    filtered_data = filtered_data[filtered_data['item_name'].isin(selected_item_names)]
+# Build the row mask for a filter selection, cached so the charts and the table share it
+@lru_cache(maxsize=256)
+def build_filter_mask(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity):
+    mask = np.ones(len(sales_over_time), dtype=bool)
 
-    filtered_data = filtered_data[(filtered_data['transaction_amount'] >= selected_transaction_amount[0]) & (filtered_data['transaction_amount'] <= selected_transaction_amount[1])]
-    filtered_data = filtered_data[(filtered_data['quantity'] >= selected_quantity[0]) & (filtered_data['quantity'] <= selected_quantity[1])]
+    if selected_month != 'All the time':
+        mask &= selected_rows('year_month', [selected_month])
+
+    # Filters left at their default of every value are skipped, so the default view does no filtering work
+    for column, selected_values in [('transaction_type', selected_payment_methods), ('time_of_sale', selected_times),
+                                    ('item_type', selected_item_types), ('item_name', selected_item_names)]:
+        if not selects_all_rows(column, selected_values):
+            mask &= selected_rows(column, selected_values)
+
+    if not covers_all_values(selected_transaction_amount, (transaction_amount_min, transaction_amount_max)):
+        mask &= (transaction_amount_values >= selected_transaction_amount[0]) & (transaction_amount_values <= selected_transaction_amount[1])
+    if not covers_all_values(selected_quantity, (quantity_min, quantity_max)):
+        mask &= (quantity_values >= selected_quantity[0]) & (quantity_values <= selected_quantity[1])
+    return mask
+
+# Dash passes lists; sort them into tuples so equivalent selections share a cache entry
+def make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity):
+    return (
+        tuple(sorted(selected_payment_methods)),
+        selected_month,
+        tuple(sorted(selected_times)),
+        tuple(sorted(selected_item_types)),
+        tuple(sorted(selected_item_names)),
+        tuple(selected_transaction_amount),
+        tuple(selected_quantity)
+    )
 
-    # Sales Trends Over Time
-    monthly_sales = filtered_data.groupby('year_month').agg({
-        'transaction_amount': 'sum'
-    }).reset_index()
-    monthly_sales['year_month'] = pd.to_datetime(monthly_sales['year_month'], format='%Y-%m')
-    monthly_sales['3month_moving_average'] = monthly_sales['transaction_amount'].rolling(window=3).mean()
+# Sales Trends Over Time
+def create_sales_trends_figure(mask):
+    monthly_sales = grouped_totals(monthly_grouping, mask)
+    monthly_sales['3month_moving_average'] = three_month_moving_average(monthly_sales['transaction_amount'].to_numpy())
 
     # Calculate IQR for transaction amounts
     Q1 = monthly_sales['transaction_amount'].quantile(0.25)
@@ -232,20 +343,11 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
     y_min = Q1 - 1.5 * IQR
     y_max = Q3 + 1.5 * IQR
 
-    # Create a figure for sales trends
-    sales_trends_fig = make_subplots(specs=[[{"secondary_y": False}]])
-
-    # Add monthly sales trace
-    sales_trends_fig.add_trace(
-        go.Scatter(x=monthly_sales['year_month'], y=monthly_sales['transaction_amount'], mode='lines+markers', name='Monthly Sales'),
-        secondary_y=False,
-    )
-
-    # Add 3-month Moving Average trace
-    sales_trends_fig.add_trace(
-        go.Scatter(x=monthly_sales['year_month'], y=monthly_sales['3month_moving_average'], mode='lines', name='3-month Moving Average'),
-        secondary_y=False,
-    )
+    # Create a figure for sales trends with the monthly sales and 3-month Moving Average traces
+    sales_trends_fig = go.Figure(data=[
+        go.Scattergl(x=monthly_sales['year_month'], y=monthly_sales['transaction_amount'], mode='lines+markers', name='Monthly Sales'),
+        go.Scattergl(x=monthly_sales['year_month'], y=monthly_sales['3month_moving_average'], mode='lines', name='3-month Moving Average')
+    ])
 
     # Adding the highest sales annotation
     max_month = monthly_sales.loc[monthly_sales['transaction_amount'].idxmax()]['year_month']
@@ -253,7 +355,7 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
     sales_trends_fig.add_annotation(
         x=max_month,
         y=max_amount,
-        text=f"Highest Sales: {max_amount}",
+        text=f"Highest Sales: {max_amount:,.2f}",
         showarrow=True,
         arrowhead=2,
         ax=20,
@@ -282,10 +384,11 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
 
-    # Payment Methods
-    payment_method_revenue = filtered_data.groupby('transaction_type').agg({
-        'transaction_amount': 'sum'
-    }).reset_index()
+    return sales_trends_fig
+
+# Payment Methods
+def create_payment_method_figure(mask):
+    payment_method_revenue = grouped_totals(payment_grouping, mask)
     payment_method_fig = px.pie(
         payment_method_revenue,
         names='transaction_type',
@@ -301,10 +404,11 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         font=dict(family='Arial', size=14, color='black')
     )
 
-    # Staff Performance
-    filtered_staff_performance = filtered_data.groupby('received_by').agg({
-        'transaction_amount': 'sum'
-    }).reset_index()
+    return payment_method_fig
+
+# Staff Performance
+def create_staff_performance_figure(mask):
+    filtered_staff_performance = grouped_totals(staff_grouping, mask)
     staff_performance_fig = px.bar(
         filtered_staff_performance, 
         x='received_by', 
@@ -323,10 +427,11 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         showlegend=False
     )
 
-    # Customer Preferences
-    grouped_data = filtered_data.groupby(['item_name', 'item_type']).agg({
-        'quantity': 'sum'
-    }).reset_index()
+    return staff_performance_fig
+
+# Customer Preferences
+def create_item_preferences_figure(mask):
+    grouped_data = grouped_totals(item_type_grouping, mask)
     item_preferences_fig = px.bar(
         grouped_data,
         x='item_name',
@@ -350,27 +455,29 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         hovertemplate='<b>Item Name:</b> %{x}<br><b>Quantity Sold:</b> %{y}<extra></extra>'
     )
 
-    # Popularity of Items at Different Times of the Day
-    filtered_heatmap_data = filtered_data.pivot_table(
-        index='time_of_sale', 
-        columns='item_name', 
-        values='quantity', 
-        aggfunc='sum',
-        fill_value=0,
-        observed=False
-    )
-    filtered_heatmap_data = filtered_heatmap_data.reset_index().melt(id_vars='time_of_sale', value_vars=filtered_heatmap_data.columns)
-    heatmap_fig = px.density_heatmap(
-        filtered_heatmap_data, 
-        x='item_name', 
-        y='time_of_sale', 
-        z='value', 
-        color_continuous_scale='Blues',
-        labels={'item_name': 'Item Name', 'time_of_sale': 'Time of Sale', 'value': 'Quantity Sold'},
-        title='Popularity of Items at Different Times of the Day',
-        category_orders={'time_of_sale': time_of_sale_order}
-    )
+    return item_preferences_fig
+
+# Popularity of Items at Different Times of the Day
+def create_heatmap_figure(mask):
+    # The matrix is summed directly, so Plotly plots it without re-binning the long-form totals
+    mask = mask & (heatmap_cell_codes >= 0)
+    n_cells = len(time_of_sale_order) * len(heatmap_items)
+    counts = np.bincount(heatmap_cell_codes[mask], minlength=n_cells).reshape(len(time_of_sale_order), len(heatmap_items))
+    matrix = masked_group_sum(mask, heatmap_cell_codes, quantity_values, n_cells).reshape(counts.shape).astype(np.float32)
+
+    # Every time of sale keeps its row, as the observed=False pivot gave it; only items with sales in the selection
+    # get a column, and empty cells show as 0
+    present_items = counts.any(axis=0)
+    heatmap_fig = go.Figure(go.Heatmap(
+        z=matrix[:, present_items],
+        x=heatmap_items[present_items].tolist(),
+        y=time_of_sale_order,
+        colorscale='Blues',
+        colorbar=dict(title='Quantity Sold'),
+        hovertemplate='Item Name=%{x}<br>Time of Sale=%{y}<br>Quantity Sold=%{z}<extra></extra>'
+    ))
     heatmap_fig.update_layout(
+        title_text='Popularity of Items at Different Times of the Day',
         template='plotly_white',
         title_font=dict(size=24, family='Arial', color='black'),
         xaxis_title='Item Name',
@@ -378,9 +485,12 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         font=dict(family='Arial', size=14, color='black')
     )
 
-    # Bubble Chart for Items
+    return heatmap_fig
+
+# Bubble Chart for Items
+def create_bubble_figure(mask):
     bubble_fig = px.scatter(
-        filtered_data.groupby(['item_name']).agg({'quantity': 'sum', 'transaction_amount': 'sum'}).reset_index(),
+        grouped_totals(item_grouping, mask),
         x='quantity',
         y='transaction_amount',
         size='quantity',
@@ -399,10 +509,18 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         showlegend=False
     )
 
-    # Sankey Diagram
-    sankey_data = filtered_data.groupby(['item_name', 'item_type', 'transaction_type']).size().reset_index(name='count')
-    all_nodes = list(sankey_data['item_name'].unique()) + list(sankey_data['item_type'].unique()) + list(sankey_data['transaction_type'].unique())
-    node_indices = {node: i for i, node in enumerate(all_nodes)}
+    return bubble_fig
+
+# Sankey Diagram
+def create_sankey_figure(mask):
+    sankey_data = grouped_totals(sankey_grouping, mask)
+    # Node indices come from factorizing each level in order of appearance, offset by the nodes of the levels before it
+    item_codes, item_nodes = pd.factorize(sankey_data['item_name'])
+    type_codes, type_nodes = pd.factorize(sankey_data['item_type'])
+    payment_codes, payment_nodes = pd.factorize(sankey_data['transaction_type'])
+    all_nodes = list(item_nodes) + list(type_nodes) + list(payment_nodes)
+    type_codes = type_codes + len(item_nodes)
+    payment_codes = payment_codes + len(item_nodes) + len(type_nodes)
     colors = px.colors.qualitative.Plotly  # Using Plotly's qualitative color scheme for better distinction
     sankey_fig = go.Figure(data=[go.Sankey(
         node=dict(
@@ -413,11 +531,9 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
             color=colors * (len(all_nodes) // len(colors) + 1)
         ),
         link=dict(
-            source=[node_indices[item] for item in sankey_data['item_name']] + 
-                   [node_indices[item] for item in sankey_data['item_type']],
-            target=[node_indices[item] for item in sankey_data['item_type']] + 
-                   [node_indices[item] for item in sankey_data['transaction_type']],
-            value=sankey_data['count'].tolist() * 2,
+            source=np.concatenate([item_codes, type_codes]),
+            target=np.concatenate([type_codes, payment_codes]),
+            value=np.tile(sankey_data['count'].to_numpy(), 2),
             color='rgba(31, 119, 180, 0.5)'
         )
     )])
@@ -427,31 +543,103 @@ def update_dashboard(selected_payment_methods, selected_month, selected_times, s
         template='plotly_white'
     )
 
-    # Create a dictionary to map chart names to their corresponding figures
-    chart_mapping = {
-        'sales_trends': sales_trends_fig,
-        'payment_methods': payment_method_fig,
-        'staff_performance': staff_performance_fig,
-        'customer_preferences': item_preferences_fig,
-        'item_popularity': heatmap_fig,
-        'high_revenue_items': bubble_fig,
-        'sankey_diagram': sankey_fig
-    }
+    return sankey_fig
+
+chart_builders = {
+    'sales_trends': create_sales_trends_figure,
+    'payment_methods': create_payment_method_figure,
+    'staff_performance': create_staff_performance_figure,
+    'customer_preferences': create_item_preferences_figure,
+    'item_popularity': create_heatmap_figure,
+    'high_revenue_items': create_bubble_figure,
+    'sankey_diagram': create_sankey_figure
+}
+
+# Layout entries that change with the filter selection; every other layout entry is the same for any selection
+data_layout_keys = {
+    'sales_trends': ['xaxis', 'yaxis', 'annotations']
+}
+
+# Only the chart picked in chart-filter is built, cached per filter selection and chart.
+# Figures are stored as plain dicts, which Dash serializes without re-validating them.
+@lru_cache(maxsize=256)
+def build_chart_figure(filter_key, selected_chart):
+    # Every chart is summed from the startup arrays; the frame itself is only indexed for the data table
+    mask = build_filter_mask(*filter_key)
+    return chart_builders[selected_chart](mask).to_dict()
+
+@app.callback(
+    Output('dashboard', 'figure'),
+    [Input('payment-filter', 'value'),
+     Input('month-filter', 'value'),
+     Input('time-of-sale-filter', 'value'),
+     Input('item-type-filter', 'value'),
+     Input('item-name-filter', 'value'),
+     Input('transaction-amount-slider', 'value'),
+     Input('quantity-slider', 'value'),
+     Input('chart-filter', 'value')]
+)
+def update_dashboard(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity, selected_chart):
+    filter_key = make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity)
 
     # Select the figure based on the user's selection
-    selected_fig = chart_mapping[selected_chart]
+    selected_fig = build_chart_figure(filter_key, selected_chart)
+
+    # The displayed chart only needs a full figure when it is first drawn or a different chart is picked
+    if ctx.triggered_id is None or ctx.triggered_id == 'chart-filter':
+        return selected_fig
+
+    # A filter change keeps the chart, so only its traces and data-dependent layout are patched;
+    # the titles, fonts and template stay in the browser and Plotly diffs the rest in place
+    patch = Patch()
+    patch['data'] = selected_fig['data']
+    for key in data_layout_keys.get(selected_chart, []):
+        if key in selected_fig['layout']:
+            patch['layout'][key] = selected_fig['layout'][key]
+    return patch
+
+@app.callback(
+    [Output('data-table', 'data'),
+     Output('data-table', 'page_count')],
+    [Input('payment-filter', 'value'),
+     Input('month-filter', 'value'),
+     Input('time-of-sale-filter', 'value'),
+     Input('item-type-filter', 'value'),
+     Input('item-name-filter', 'value'),
+     Input('transaction-amount-slider', 'value'),
+     Input('quantity-slider', 'value'),
+     Input('data-table', 'page_current'),
+     Input('data-table', 'page_size')]
+)
+def update_data_table(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity, page_current, page_size):
+    filter_key = make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity)
+    mask = build_filter_mask(*filter_key)
+
+    # Only the rows of the current page are converted to records
+    filtered_rows = np.flatnonzero(mask)
+    page_rows = filtered_rows[page_current * page_size:(page_current + 1) * page_size]
+    page_count = max(1, -(-len(filtered_rows) // page_size))
 
-    return selected_fig, filtered_data.to_dict('records')
+    return sales_over_time.iloc[page_rows].to_dict('records'), page_count
 
 @app.callback(
     Output("download-dataframe-csv", "data"),
     [Input("download-button", "n_clicks")],
+    [State('payment-filter', 'value'),
+     State('month-filter', 'value'),
+     State('time-of-sale-filter', 'value'),
+     State('item-type-filter', 'value'),
+     State('item-name-filter', 'value'),
+     State('transaction-amount-slider', 'value'),
+     State('quantity-slider', 'value')],
     prevent_initial_call=True,
 )
-def download_filtered_data(n_clicks):
-    filtered_data = update_dashboard.callback_context.states['data-table.data']
-    df = pd.DataFrame(filtered_data)
-    return dcc.send_data_frame(df.to_csv, "filtered_data.csv")
+def download_filtered_data(n_clicks, selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity):
+    # The table only holds the current page, so the rows are taken from the cached filter mask instead
+    filter_key = make_filter_key(selected_payment_methods, selected_month, selected_times, selected_item_types, selected_item_names, selected_transaction_amount, selected_quantity)
+    filtered_data = sales_over_time.iloc[np.flatnonzero(build_filter_mask(*filter_key))]
+    return dcc.send_data_frame(filtered_data.to_csv, "filtered_data.csv", index=False)
 
 if __name__ == '__main__':
-    app.run_server(debug=True)
+    # Debug mode (reloader and dev tools) is off unless DASH_DEBUG=true is set
+    app.run_server()
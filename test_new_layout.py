@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -6,36 +9,94 @@ from dash.dependencies import Input, Output
 from dash import dash_table
 from plotly.subplots import make_subplots
 
+from sales_data_cache import load_sales_data, parse_dates
+
 # Load the dataset
 file_path = 'Balaji Fast Food Sales.csv'
-sales_over_time = pd.read_csv(file_path)
+parquet_stem = 'Balaji Fast Food Sales.new_layout'
+
+# Explicit column types, so the text columns are read straight into categoricals without dtype inference
+csv_dtypes = {
+    'item_name': 'category',
+    'item_type': 'category',
+    'transaction_type': 'category',
+    'received_by': 'category',
+    'time_of_sale': 'category',
+    # The numeric columns fit in 32 bits, which halves what every mask and sum reads
+    'order_id': 'int32',
+    'quantity': 'int32',
+    'transaction_amount': 'float32'
+}
 
-# Ensure sales_over_time['date'] is in datetime format
-def parse_date(date_str):
-    for fmt in ('%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y'):
-        try:
-            return pd.to_datetime(date_str, format=fmt)
-        except ValueError:
-            pass
-    return pd.to_datetime(date_str, errors='coerce')
+time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
 
-sales_over_time['date'] = sales_over_time['date'].apply(parse_date)
+def load_sales_csv(file_path):
+    sales_over_time = pd.read_csv(file_path, dtype=csv_dtypes)
 
-# Drop rows with invalid dates
-sales_over_time = sales_over_time.dropna(subset=['date'])
+    sales_over_time['date'] = parse_dates(sales_over_time['date'])
 
-# Extract month and year for filtering
-sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str)
+    # Drop rows with invalid dates
+    sales_over_time = sales_over_time.dropna(subset=['date'])
 
-# Ensure 'time_of_sale' has the correct order
-time_of_sale_order = ['Morning', 'Afternoon', 'Evening', 'Night', 'Midnight']
-sales_over_time['time_of_sale'] = pd.Categorical(sales_over_time['time_of_sale'], categories=time_of_sale_order, ordered=True)
+    # Extract month and year for filtering
+    sales_over_time['year_month'] = sales_over_time['date'].dt.to_period('M').astype(str)
+
+    # Ensure 'time_of_sale' has the correct order
+    sales_over_time['time_of_sale'] = pd.Categorical(sales_over_time['time_of_sale'], categories=time_of_sale_order, ordered=True)
+
+    # Drop rows with null transaction types
+    sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
+
+    # Ensure transaction_type has no leading/trailing spaces
+    sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip()
+
+    # Low-cardinality text columns are stored as categoricals; the dropdown filters compare their integer codes
+    for column in ['item_type', 'item_name', 'transaction_type', 'received_by']:
+        sales_over_time[column] = sales_over_time[column].astype('category')
+
+    # Sort by date once, so a date range is a contiguous slice found by binary search
+    return sales_over_time.sort_values('date', kind='stable').reset_index(drop=True)
 
-# Drop rows with null transaction types
-sales_over_time = sales_over_time.dropna(subset=['transaction_type'])
+# The cleaned dataset is cached as Parquet next to the CSV, so later starts skip the CSV and date parsing;
+# see sales_data_cache for when the cache is rebuilt
+sales_over_time = load_sales_data(file_path, parquet_stem, load_sales_csv)
 
-# Ensure transaction_type has no leading/trailing spaces
-sales_over_time['transaction_type'] = sales_over_time['transaction_type'].str.strip()
+date_values = sales_over_time['date'].to_numpy()
+transaction_amount_values = sales_over_time['transaction_amount'].to_numpy()
+quantity_values = sales_over_time['quantity'].to_numpy()
+# Slider bounds, read once from the numpy arrays instead of rescanning the columns for every slider argument
+transaction_amount_min, transaction_amount_max = transaction_amount_values.min().item(), transaction_amount_values.max().item()
+quantity_min, quantity_max = quantity_values.min().item(), quantity_values.max().item()
+category_codes = {column: sales_over_time[column].cat.codes.to_numpy() for column in ['item_type', 'item_name', 'transaction_type']}
+
+# Whether a column has rows with no category (code -1); those rows never match a dropdown selection
+has_missing_category = {column: bool((codes < 0).any()) for column, codes in category_codes.items()}
+
+# Lookup table indexed by category code, True for the selected categories; unknown values match nothing.
+# The extra last slot is what code -1 reads, so rows with no category stay unselected.
+def selected_category_table(column, selected_values):
+    selected_codes = sales_over_time[column].cat.categories.get_indexer(selected_values)
+    selected = np.zeros(len(sales_over_time[column].cat.categories) + 1, dtype=bool)
+    selected[selected_codes[selected_codes >= 0]] = True
+    return selected
+
+# Dropdown choices are the categories that occur, read off the codes once and shared by the options and the default selection
+def present_categories(column):
+    codes = category_codes[column]
+    return sales_over_time[column].cat.categories[np.unique(codes[codes >= 0])].tolist()
+
+item_types = present_categories('item_type')
+item_names = present_categories('item_name')
+payment_methods = present_categories('transaction_type')
+item_type_options = [{'label': item_type, 'value': item_type} for item_type in item_types]
+item_name_options = [{'label': item_name, 'value': item_name} for item_name in item_names]
+payment_method_options = [{'label': method, 'value': method} for method in payment_methods]
+
+# Day, week-start and month-start of every sale, computed once with vectorized period start times.
+# Grouping by these aligns on the row index, so a filtered frame picks out its own rows' keys.
+sale_days = sales_over_time['date'].dt.floor('D').rename('date')
+sale_week_starts = sales_over_time['date'].dt.to_period('W').dt.start_time.rename('date')
+sale_month_starts = sales_over_time['date'].dt.to_period('M').dt.start_time.rename('date')
 
 # Calculate Overall Performance Metrics
 total_sales = sales_over_time['transaction_amount'].sum()
@@ -52,37 +113,59 @@ color_palette = {
     'categories': ['#1f77b4', '#aec7e8', '#ffbb78', '#ff7f0e', '#2ca02c']  # Different shades for categories
 }
 
+# The figures below are drawn from already aggregated totals, so they are built with go traces
+# directly instead of going through plotly express' column inference
+def create_sales_line_figure(sales, title, color):
+    sales_line_fig = go.Figure(go.Scatter(
+        x=sales.index.to_numpy(),
+        y=sales.to_numpy(),
+        mode='lines',
+        line=dict(color=color),
+        hovertemplate=f'{sales.index.name}=%{{x}}<br>{sales.name}=%{{y}}<extra></extra>'
+    ))
+    sales_line_fig.update_layout(
+        title_text=title,
+        xaxis_title=sales.index.name,
+        yaxis_title=sales.name,
+        plot_bgcolor=color_palette['background']
+    )
+    return sales_line_fig
+
+# One bar per category, colored in turn from the category palette; the bars are labelled on the x axis, so no legend
+def create_category_bar_figure(totals, title):
+    category_bar_fig = go.Figure(go.Bar(
+        x=totals.index.to_numpy(),
+        y=totals.to_numpy(),
+        marker_color=[color_palette['categories'][i % len(color_palette['categories'])] for i in range(len(totals))],
+        hovertemplate=f'{totals.index.name}=%{{x}}<br>{totals.name}=%{{y}}<extra></extra>'
+    ))
+    category_bar_fig.update_layout(
+        title_text=title,
+        xaxis_title=totals.index.name,
+        yaxis_title=totals.name,
+        showlegend=False,
+        plot_bgcolor=color_palette['background']
+    )
+    return category_bar_fig
+
 # Create Sales Trends Figures
-sales_over_day_fig = px.line(
-    sales_over_time.groupby(sales_over_time['date'].dt.date)['transaction_amount'].sum().reset_index(),
-    x='date',
-    y='transaction_amount',
-    title='Sales Trends Over Day',
-    color_discrete_sequence=[color_palette['primary']]
-)
-sales_over_day_fig.update_layout(plot_bgcolor=color_palette['background'])
+sales_over_day_fig = create_sales_line_figure(sales_over_time.groupby(sale_days)['transaction_amount'].sum(), 'Sales Trends Over Day', color_palette['primary'])
+sales_over_week_fig = create_sales_line_figure(sales_over_time.groupby(sale_week_starts)['transaction_amount'].sum(), 'Sales Trends Over Week', color_palette['primary'])
+sales_over_month_fig = create_sales_line_figure(sales_over_time.groupby(sale_month_starts)['transaction_amount'].sum(), 'Sales Trends Over Month', color_palette['primary'])
 
-sales_over_week_fig = px.line(
-    sales_over_time.groupby(sales_over_time['date'].dt.to_period('W').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
-    x='date',
-    y='transaction_amount',
-    title='Sales Trends Over Week',
-    color_discrete_sequence=[color_palette['primary']]
-)
-sales_over_week_fig.update_layout(plot_bgcolor=color_palette['background'])
+# bottleneck's C kernel is used when it is installed, otherwise pandas' rolling mean
+try:
+    from bottleneck import move_mean
 
-sales_over_month_fig = px.line(
-    sales_over_time.groupby(sales_over_time['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
-    x='date',
-    y='transaction_amount',
-    title='Sales Trends Over Month',
-    color_discrete_sequence=[color_palette['primary']]
-)
-sales_over_month_fig.update_layout(plot_bgcolor=color_palette['background'])
+    def three_month_moving_average(values):
+        return move_mean(values, window=3)
+except ImportError:
+    def three_month_moving_average(values):
+        return pd.Series(values).rolling(window=3).mean().to_numpy()
 
 # Create Interactive Line Chart with Monthly Sales Trends and 3-Month Moving Average
-monthly_sales = sales_over_time.groupby(sales_over_time['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index()
-monthly_sales['3_month_MA'] = monthly_sales['transaction_amount'].rolling(window=3).mean()
+monthly_sales = sales_over_time.groupby(sale_month_starts)['transaction_amount'].sum().reset_index()
+monthly_sales['3_month_MA'] = three_month_moving_average(monthly_sales['transaction_amount'].to_numpy(dtype=np.float64))
 
 interactive_sales_trends_fig = make_subplots(specs=[[{"secondary_y": True}]])
 
@@ -105,47 +188,25 @@ interactive_sales_trends_fig.update_layout(
 )
 interactive_sales_trends_fig.update_layout(plot_bgcolor=color_palette['background'])
 
-time_of_day_fig = px.line(
-    sales_over_time.groupby('time_of_sale')['transaction_amount'].sum().reset_index(),
-    x='time_of_sale',
-    y='transaction_amount',
-    title='Sales by Time of Day',
-    color_discrete_sequence=[color_palette['secondary']]
-)
-time_of_day_fig.update_layout(plot_bgcolor=color_palette['background'])
+time_of_day_fig = create_sales_line_figure(sales_over_time.groupby('time_of_sale', observed=True)['transaction_amount'].sum(), 'Sales by Time of Day', color_palette['secondary'])
 
 # Create Figures for Operational Performance and Item-Based Sales Analysis
-payment_method_fig = px.pie(
-    sales_over_time,
-    names='transaction_type',
-    values='transaction_amount',
-    title='Sales by Payment Method',
-    color_discrete_sequence=color_palette['categories']
-)
-payment_method_fig.update_layout(plot_bgcolor=color_palette['background'])
+# The pie is drawn from the per-payment-method totals, summed once here rather than inside plotly
+payment_method_totals = sales_over_time.groupby('transaction_type', observed=True, sort=False)['transaction_amount'].sum()
+payment_method_fig = go.Figure(go.Pie(
+    labels=payment_method_totals.index.to_numpy(),
+    values=payment_method_totals.to_numpy(),
+    marker=dict(colors=color_palette['categories']),
+    hovertemplate='transaction_type=%{label}<br>transaction_amount=%{value}<extra></extra>'
+))
+payment_method_fig.update_layout(title_text='Sales by Payment Method', plot_bgcolor=color_palette['background'])
 
-staff_performance_fig = px.bar(
-    sales_over_time.groupby('received_by')['transaction_amount'].sum().reset_index(),
-    x='received_by',
-    y='transaction_amount',
-    title='Sales by Staff Gender',
-    color='received_by',
-    color_discrete_sequence=color_palette['categories']
-)
-staff_performance_fig.update_layout(plot_bgcolor=color_palette['background'])
+staff_performance_fig = create_category_bar_figure(sales_over_time.groupby('received_by', observed=True)['transaction_amount'].sum(), 'Sales by Staff Gender')
 
-item_preferences_fig = px.bar(
-    sales_over_time.groupby('item_name')['quantity'].sum().nlargest(5).reset_index(),
-    x='item_name',
-    y='quantity',
-    title='Top-Selling Items',
-    color='item_name',
-    color_discrete_sequence=color_palette['categories']
-)
-item_preferences_fig.update_layout(plot_bgcolor=color_palette['background'])
+item_preferences_fig = create_category_bar_figure(sales_over_time.groupby('item_name', observed=True, sort=False)['quantity'].sum().nlargest(5), 'Top-Selling Items')
 
 high_revenue_items_fig = px.scatter(
-    sales_over_time.groupby('item_name')['transaction_amount'].sum().nlargest(5).reset_index(),
+    sales_over_time.groupby('item_name', observed=True, sort=False)['transaction_amount'].sum().nlargest(5).reset_index(),
     x='item_name',
     y='transaction_amount',
     size='transaction_amount',
@@ -155,34 +216,35 @@ high_revenue_items_fig = px.scatter(
 )
 high_revenue_items_fig.update_layout(plot_bgcolor=color_palette['background'])
 
-day_of_week_fig = px.bar(
-    sales_over_time.groupby(sales_over_time['date'].dt.day_name())['transaction_amount'].sum().reset_index(),
-    x='date',
-    y='transaction_amount',
-    title='Sales by Day of Week',
-    color='date',
-    color_discrete_sequence=color_palette['categories']
+day_of_week_fig = create_category_bar_figure(sales_over_time.groupby(sales_over_time['date'].dt.day_name())['transaction_amount'].sum(), 'Sales by Day of Week')
+
+# Create the heatmap data: a time of sale by item matrix of quantities sold
+heatmap_data = sales_over_time.pivot_table(index='time_of_sale', columns='item_name', values='quantity', aggfunc='sum', fill_value=0, observed=True)
+
+# Create the heatmap figure straight from the matrix, without melting it back to long form
+heatmap_fig = go.Figure(go.Heatmap(
+    z=heatmap_data.to_numpy(),
+    x=heatmap_data.columns.to_numpy(),
+    y=heatmap_data.index.to_numpy(),
+    colorscale='Blues',
+    colorbar=dict(title='sum of value'),
+    hovertemplate='item_name=%{x}<br>time_of_sale=%{y}<br>sum of value=%{z}<extra></extra>'
+))
+heatmap_fig.update_layout(
+    title_text='Item Popularity Heatmap',
+    xaxis_title='item_name',
+    yaxis_title='time_of_sale',
+    plot_bgcolor=color_palette['background']
 )
-day_of_week_fig.update_layout(plot_bgcolor=color_palette['background'])
-
-# Create the heatmap data
-heatmap_data = sales_over_time.pivot_table(index='time_of_sale', columns='item_name', values='quantity', aggfunc='sum', fill_value=0, observed=False).reset_index().melt(id_vars='time_of_sale', value_vars=sales_over_time['item_name'].unique())
-
-# Create the heatmap figure
-heatmap_fig = px.density_heatmap(
-    heatmap_data,
-    x='item_name',
-    y='time_of_sale',
-    z='value',
-    title='Item Popularity Heatmap',
-    color_continuous_scale=px.colors.sequential.Blues
-)
-heatmap_fig.update_layout(plot_bgcolor=color_palette['background'])
 
 # Create Sankey Diagram
-sankey_data = sales_over_time.groupby(['item_name', 'item_type', 'transaction_type']).size().reset_index(name='count')
-all_nodes = list(sankey_data['item_name'].unique()) + list(sankey_data['item_type'].unique()) + list(sankey_data['transaction_type'].unique())
-node_indices = {node: i for i, node in enumerate(all_nodes)}
+sankey_data = sales_over_time.groupby(['item_name', 'item_type', 'transaction_type'], observed=True, sort=False).size().reset_index(name='count')
+# Each level's nodes are its categories that have flows; a row's node index is its category code
+# plus the number of nodes in the levels before it, so the links are built without per-row lookups
+sankey_levels = [sankey_data[column].cat.remove_unused_categories() for column in ['item_name', 'item_type', 'transaction_type']]
+level_offsets = np.cumsum([0] + [len(level.cat.categories) for level in sankey_levels[:-1]])
+level_nodes = [level.cat.codes.to_numpy() + offset for level, offset in zip(sankey_levels, level_offsets)]
+all_nodes = [node for level in sankey_levels for node in level.cat.categories]
 sankey_fig = go.Figure(data=[go.Sankey(
     node=dict(
         pad=15,
@@ -192,11 +254,9 @@ sankey_fig = go.Figure(data=[go.Sankey(
         color=color_palette['categories']
     ),
     link=dict(
-        source=[node_indices[item] for item in sankey_data['item_name']] + 
-               [node_indices[item] for item in sankey_data['item_type']],
-        target=[node_indices[item] for item in sankey_data['item_type']] + 
-               [node_indices[item] for item in sankey_data['transaction_type']],
-        value=sankey_data['count'].tolist() * 2,
+        source=np.concatenate(level_nodes[:2]),
+        target=np.concatenate(level_nodes[1:]),
+        value=np.tile(sankey_data['count'].to_numpy(), 2),
         color='rgba(31, 119, 180, 0.5)'
     )
 )])
@@ -246,8 +306,8 @@ app.layout = html.Div([
             html.Label('Filter by Item Type:'),
             dcc.Dropdown(
                 id='item-type-dropdown',
-                options=[{'label': item_type, 'value': item_type} for item_type in sales_over_time['item_type'].unique()],
-                value=sales_over_time['item_type'].unique().tolist(),
+                options=item_type_options,
+                value=item_types,
                 multi=True,
                 clearable=False
             ),
@@ -256,8 +316,8 @@ app.layout = html.Div([
             html.Label('Filter by Item Name:'),
             dcc.Dropdown(
                 id='item-name-dropdown',
-                options=[{'label': item_name, 'value': item_name} for item_name in sales_over_time['item_name'].unique()],
-                value=sales_over_time['item_name'].unique().tolist(),
+                options=item_name_options,
+                value=item_names,
                 multi=True,
                 clearable=False
             ),
@@ -266,8 +326,8 @@ app.layout = html.Div([
             html.Label('Filter by Payment Method:'),
             dcc.Dropdown(
                 id='payment-method-dropdown',
-                options=[{'label': method, 'value': method} for method in sales_over_time['transaction_type'].unique()],
-                value=sales_over_time['transaction_type'].unique().tolist(),
+                options=payment_method_options,
+                value=payment_methods,
                 multi=True,
                 clearable=False
             ),
@@ -276,22 +336,22 @@ app.layout = html.Div([
             html.Label('Filter by Transaction Amount:'),
             dcc.RangeSlider(
                 id='transaction-amount-slider',
-                min=sales_over_time['transaction_amount'].min(),
-                max=sales_over_time['transaction_amount'].max(),
-                value=[sales_over_time['transaction_amount'].min(), sales_over_time['transaction_amount'].max()],
-                marks={int(sales_over_time['transaction_amount'].min()): str(int(sales_over_time['transaction_amount'].min())),
-                       int(sales_over_time['transaction_amount'].max()): str(int(sales_over_time['transaction_amount'].max()))}
+                min=transaction_amount_min,
+                max=transaction_amount_max,
+                value=[transaction_amount_min, transaction_amount_max],
+                marks={int(transaction_amount_min): str(int(transaction_amount_min)),
+                       int(transaction_amount_max): str(int(transaction_amount_max))}
             ),
         ], style={'margin': '20px'}),
         html.Div([
             html.Label('Filter by Quantity:'),
             dcc.RangeSlider(
                 id='quantity-slider',
-                min=sales_over_time['quantity'].min(),
-                max=sales_over_time['quantity'].max(),
-                value=[sales_over_time['quantity'].min(), sales_over_time['quantity'].max()],
-                marks={int(sales_over_time['quantity'].min()): str(int(sales_over_time['quantity'].min())),
-                       int(sales_over_time['quantity'].max()): str(int(sales_over_time['quantity'].max()))}
+                min=quantity_min,
+                max=quantity_max,
+                value=[quantity_min, quantity_max],
+                marks={int(quantity_min): str(int(quantity_min)),
+                       int(quantity_max): str(int(quantity_max))}
             ),
         ], style={'margin': '20px'}),
         html.Div([
@@ -340,6 +400,9 @@ app.layout = html.Div([
     dash_table.DataTable(
         id='data-table',
         columns=[{"name": i, "id": i} for i in sales_over_time.columns],
+        # Pages are sliced on the server, so only the visible rows are serialized
+        page_action='custom',
+        page_current=0,
         page_size=10,
         style_table={'height': '400px', 'overflowY': 'auto'},
         style_cell={'textAlign': 'left', 'padding': '5px'},
@@ -350,61 +413,56 @@ app.layout = html.Div([
     dcc.Download(id="download-dataframe-csv")
 ])
 
-@app.callback(
-    [Output("sales-trends-over-time", "figure"),
-     Output("data-table", "data")],
-    [Input("date-range", "start_date"),
-     Input("date-range", "end_date"),
-     Input("transaction-amount-slider", "value"),
-     Input("quantity-slider", "value"),
-     Input("item-type-dropdown", "value"),
-     Input("item-name-dropdown", "value"),
-     Input("payment-method-dropdown", "value"),
-     Input("sales-trends-dropdown", "value")]
-)
-def update_dashboard(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, selected_sales_trends):
-    filtered_data = sales_over_time[
-        (sales_over_time['date'] >= start_date) & 
-        (sales_over_time['date'] <= end_date) & 
-        (sales_over_time['transaction_amount'] >= transaction_amount_range[0]) & 
-        (sales_over_time['transaction_amount'] <= transaction_amount_range[1]) &
-        (sales_over_time['quantity'] >= quantity_range[0]) &
-        (sales_over_time['quantity'] <= quantity_range[1]) &
-        (sales_over_time['item_type'].isin(selected_item_types)) &
-        (sales_over_time['item_name'].isin(selected_item_names)) &
-        (sales_over_time['transaction_type'].isin(selected_payment_methods))
-    ]
-
-    # Update Sales Trends Over Day, Week, Month, and Interactive
-    sales_over_day_fig = px.line(
-        filtered_data.groupby(filtered_data['date'].dt.date)['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales Trends Over Day',
-        color_discrete_sequence=[color_palette['primary']]
-    )
-    sales_over_day_fig.update_layout(plot_bgcolor=color_palette['background'])
-
-    sales_over_week_fig = px.line(
-        filtered_data.groupby(filtered_data['date'].dt.to_period('W').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales Trends Over Week',
-        color_discrete_sequence=[color_palette['primary']]
+# Dash passes lists; sort them into tuples so equivalent selections share a cache entry
+def make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    return (
+        start_date,
+        end_date,
+        tuple(transaction_amount_range),
+        tuple(quantity_range),
+        tuple(sorted(selected_item_types)),
+        tuple(sorted(selected_item_names)),
+        tuple(sorted(selected_payment_methods))
     )
-    sales_over_week_fig.update_layout(plot_bgcolor=color_palette['background'])
-
-    sales_over_month_fig = px.line(
-        filtered_data.groupby(filtered_data['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index(),
-        x='date',
-        y='transaction_amount',
-        title='Sales Trends Over Month',
-        color_discrete_sequence=[color_palette['primary']]
-    )
-    sales_over_month_fig.update_layout(plot_bgcolor=color_palette['background'])
 
-    monthly_sales = filtered_data.groupby(filtered_data['date'].dt.to_period('M').apply(lambda r: r.start_time))['transaction_amount'].sum().reset_index()
-    monthly_sales['3_month_MA'] = monthly_sales['transaction_amount'].rolling(window=3).mean()
+# The filtered rows for a filter selection, cached so the sales trends figure and the table share them
+@lru_cache(maxsize=128)
+def build_filtered_data(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods):
+    # The date range is cut from the sorted rows with a binary search; the other filters only mask that slice
+    lo = np.searchsorted(date_values, pd.Timestamp(start_date).to_datetime64(), side='left')
+    hi = np.searchsorted(date_values, pd.Timestamp(end_date).to_datetime64(), side='right')
+    rows = slice(lo, max(lo, hi))
+
+    # Each filter is ANDed into one mask through a single scratch buffer, so no temporary arrays pile up,
+    # and filters left at their default of every value are skipped, so the default view does no masking work
+    mask = np.ones(rows.stop - rows.start, dtype=bool)
+    scratch = np.empty_like(mask)
+    for values, (low, high), (value_min, value_max) in [(transaction_amount_values, transaction_amount_range, (transaction_amount_min, transaction_amount_max)),
+                                                        (quantity_values, quantity_range, (quantity_min, quantity_max))]:
+        if low > value_min or high < value_max:
+            mask &= np.greater_equal(values[rows], low, out=scratch)
+            mask &= np.less_equal(values[rows], high, out=scratch)
+    for column, selected_values in [('item_type', selected_item_types), ('item_name', selected_item_names),
+                                    ('transaction_type', selected_payment_methods)]:
+        selected = selected_category_table(column, selected_values)
+        if has_missing_category[column] or not selected[:-1].all():
+            mask &= np.take(selected, category_codes[column][rows], out=scratch)
+    return sales_over_time.iloc[rows][mask]
+
+# Sales Trends Over Day, Week and Month
+def create_sales_over_day_figure(filtered_data):
+    return create_sales_line_figure(filtered_data.groupby(sale_days)['transaction_amount'].sum(), 'Sales Trends Over Day', color_palette['primary'])
+
+def create_sales_over_week_figure(filtered_data):
+    return create_sales_line_figure(filtered_data.groupby(sale_week_starts)['transaction_amount'].sum(), 'Sales Trends Over Week', color_palette['primary'])
+
+def create_sales_over_month_figure(filtered_data):
+    return create_sales_line_figure(filtered_data.groupby(sale_month_starts)['transaction_amount'].sum(), 'Sales Trends Over Month', color_palette['primary'])
+
+# Interactive Sales Trends with the 3-Month Moving Average
+def create_interactive_sales_trends_figure(filtered_data):
+    monthly_sales = filtered_data.groupby(sale_month_starts)['transaction_amount'].sum().reset_index()
+    monthly_sales['3_month_MA'] = three_month_moving_average(monthly_sales['transaction_amount'].to_numpy(dtype=np.float64))
 
     interactive_sales_trends_fig = make_subplots(specs=[[{"secondary_y": True}]])
 
@@ -426,19 +484,68 @@ def update_dashboard(start_date, end_date, transaction_amount_range, quantity_ra
         template='plotly_white'
     )
     interactive_sales_trends_fig.update_layout(plot_bgcolor=color_palette['background'])
+    return interactive_sales_trends_fig
+
+# Sales by time of day is drawn from every row and does not follow the filters
+def create_time_of_day_figure(filtered_data):
+    return time_of_day_fig
+
+sales_trends_builders = {
+    'day': create_sales_over_day_figure,
+    'week': create_sales_over_week_figure,
+    'month': create_sales_over_month_figure,
+    'interactive': create_interactive_sales_trends_figure,
+    'time_of_day': create_time_of_day_figure
+}
+
+# Only the selected sales trends figure is built, cached per filter selection and figure.
+# Figures are stored as plain dicts, which Dash serializes without re-validating them.
+@lru_cache(maxsize=128)
+def build_sales_trends_figure(filter_key, selected_sales_trends):
+    return sales_trends_builders[selected_sales_trends](build_filtered_data(*filter_key)).to_dict()
+
+@app.callback(
+    Output("sales-trends-over-time", "figure"),
+    [Input("date-range", "start_date"),
+     Input("date-range", "end_date"),
+     Input("transaction-amount-slider", "value"),
+     Input("quantity-slider", "value"),
+     Input("item-type-dropdown", "value"),
+     Input("item-name-dropdown", "value"),
+     Input("payment-method-dropdown", "value"),
+     Input("sales-trends-dropdown", "value")]
+)
+def update_dashboard(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, selected_sales_trends):
+    filter_key = make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods)
+    return build_sales_trends_figure(filter_key, selected_sales_trends)
+
+@app.callback(
+    [Output("data-table", "data"),
+     Output("data-table", "page_count")],
+    [Input("date-range", "start_date"),
+     Input("date-range", "end_date"),
+     Input("transaction-amount-slider", "value"),
+     Input("quantity-slider", "value"),
+     Input("item-type-dropdown", "value"),
+     Input("item-name-dropdown", "value"),
+     Input("payment-method-dropdown", "value"),
+     Input("data-table", "page_current"),
+     Input("data-table", "page_size")]
+)
+def update_data_table(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods, page_current, page_size):
+    filter_key = make_filter_key(start_date, end_date, transaction_amount_range, quantity_range, selected_item_types, selected_item_names, selected_payment_methods)
+    filtered_data = build_filtered_data(*filter_key)
+
+    # Only the rows of the current page are converted to records
+    page_start = page_current * page_size
+    page_count = max(1, -(-len(filtered_data) // page_size))
 
-    if selected_sales_trends == 'day':
-        sales_trends_fig = sales_over_day_fig
-    elif selected_sales_trends == 'week':
-        sales_trends_fig = sales_over_week_fig
-    elif selected_sales_trends == 'month':
-        sales_trends_fig = sales_over_month_fig
-    elif selected_sales_trends == 'interactive':
-        sales_trends_fig = interactive_sales_trends_fig
-    elif selected_sales_trends == 'time_of_day':
-        sales_trends_fig = time_of_day_fig
+    return filtered_data.iloc[page_start:page_start + page_size].to_dict('records'), page_count
 
-    return sales_trends_fig, filtered_data.to_dict('records')
+# The download is the whole, unchanging dataset, so it is written out as CSV on the first click and reused after that
+@lru_cache(maxsize=1)
+def dataset_csv():
+    return sales_over_time.to_csv()
 
 @app.callback(
     Output("download-dataframe-csv", "data"),
@@ -446,7 +553,7 @@ def update_dashboard(start_date, end_date, transaction_amount_range, quantity_ra
     prevent_initial_call=True,
 )
 def download_filtered_data(n_clicks):
-    return dcc.send_data_frame(sales_over_time.to_csv, "Balaji_Fast_Food_Sales.csv")
+    return dcc.send_string(dataset_csv(), "Balaji_Fast_Food_Sales.csv")
 
 if __name__ == '__main__':
     app.run_server(debug=True)